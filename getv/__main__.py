@@ -25,7 +25,7 @@ def _default_manager() -> ProfileManager:
     base = os.environ.get("GETV_HOME", "~/.getv")
     pm = ProfileManager(base)
     # Auto-discover existing categories from subdirectories
-    base_path = Path(base).expanduser().resolve()
+    base_path = pm.base_dir
     if base_path.exists():
         for d in sorted(base_path.iterdir()):
             if d.is_dir() and not d.name.startswith("."):
@@ -191,16 +191,16 @@ def set_cmd(ctx: clickmd.Context, category: str, profile: str, pairs: tuple) ->
     getv set devices rpi3 RPI_HOST=192.168.1.10 RPI_USER=pi RPI_PORT=22
     ```
     """
-    pm = ProfileManager(ctx.obj["home"])
-    pm.add_category(category)
     data = {}
     for pair in pairs:
-        if "=" not in pair:
+        k, sep, v = pair.partition("=")
+        if not sep:
             clickmd.echo(f"Invalid format: {pair} (expected KEY=VALUE)", err=True)
             raise SystemExit(1)
-        k, _, v = pair.partition("=")
         data[k.strip()] = v.strip()
 
+    pm = ProfileManager(ctx.obj["home"])
+    pm.add_category(category)
     store = pm.set(category, profile, data)
     clickmd.echo(f"Saved {len(data)} var(s) to {store.path}")
 
@@ -222,7 +222,7 @@ def list_cmd(ctx: clickmd.Context, category: str, profile: str, show_secrets: bo
     ```
     """
     pm = ProfileManager(ctx.obj["home"])
-    base = Path(ctx.obj["home"]).expanduser().resolve()
+    base = pm.base_dir
 
     if not category:
         # List categories
@@ -952,7 +952,7 @@ def import_cmd(ctx: clickmd.Context, file_path: str, category: str, profile: str
                         data[k.strip()] = v.strip()
     else:
         # Parse as .env file
-        store = EnvStore(import_path, auto_create=False)
+        store = EnvStore(import_path, auto_create=False, readonly=True)
         data = store.as_dict()
 
     if not data:
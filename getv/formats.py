@@ -5,6 +5,20 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional, Type
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ' -> '\'' (close quote, escaped quote, reopen) inside single-quoted shell words
+_QUOTE = "'"
+_SHELL_TRANS = str.maketrans({_QUOTE: "'\\''"})
+
+
+def shell_quote(value: str) -> str:
+    """Quote a value as one single-quoted POSIX shell word."""
+    return f"'{value.translate(_SHELL_TRANS) if _QUOTE in value else value}'"
+
 
 def to_dict(data: Dict[str, str]) -> Dict[str, str]:
     """Identity — return a plain dict copy."""
@@ -13,16 +27,19 @@ def to_dict(data: Dict[str, str]) -> Dict[str, str]:
 
 def to_json(data: Dict[str, str], indent: int = 2) -> str:
     """Export as formatted JSON string."""
+    if orjson is not None and indent == 2:
+        # Same layout as json.dumps(indent=2), C-backed encoder
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(data, indent=indent, ensure_ascii=False)
 
 
 def to_shell_export(data: Dict[str, str]) -> str:
     """Generate shell `export KEY='value'` statements."""
-    lines = []
-    for key, value in sorted(data.items()):
-        escaped = value.replace("'", "'\\''")
-        lines.append(f"export {key}='{escaped}'")
-    return "\n".join(lines)
+    # A list comprehension, not a generator: join() would build the list anyway
+    return "\n".join([
+        f"export {key}={shell_quote(value)}"
+        for key, value in sorted(data.items())
+    ])
 
 
 def to_docker_env(data: Dict[str, str]) -> str:
@@ -1 +1,6 @@
 """getv integrations — plugins for common tools and services."""
+
+import sys
+
+# Keyword args for config dataclasses: __slots__ where the interpreter supports it (3.10+)
+DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -36,13 +36,15 @@ import tempfile
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 
 # ─── Prefix → Provider mapping ───────────────────────────────────────────────
 
-PREFIX_RULES: List[Tuple[str, str, str, str]] = [
+PREFIX_RULES: Tuple[Tuple[str, str, str, str], ...] = (
     # (prefix,        provider,       env_var,                console_domain)
     ("sk-ant-",       "anthropic",    "ANTHROPIC_API_KEY",    "console.anthropic.com"),
     ("sk-or-",        "openrouter",   "OPENROUTER_API_KEY",   "openrouter.ai"),
@@ -63,10 +65,18 @@ PREFIX_RULES: List[Tuple[str, str, str, str]] = [
     ("AKIA",          "aws",          "AWS_ACCESS_KEY_ID",    "console.aws.amazon.com"),
     ("dop_v1_",       "digitalocean", "DIGITALOCEAN_TOKEN",   "cloud.digitalocean.com"),
     ("tskey-",        "tailscale",    "TAILSCALE_API_KEY",    "login.tailscale.com"),
-]
+)
+
+# Alternatives in PREFIX_RULES order, so the first listed rule wins exactly as
+# a linear startswith() scan would (sk-ant- before sk-, ...)
+_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix, _, _, _ in PREFIX_RULES))
+_BY_PREFIX: Dict[str, Tuple[str, str, str]] = {
+    prefix: (provider, env_var, domain)
+    for prefix, provider, env_var, domain in reversed(PREFIX_RULES)  # first rule wins
+}
 
 # Domain → provider mapping for browser history fallback
-DOMAIN_MAP: Dict[str, Tuple[str, str]] = {
+DOMAIN_MAP: Mapping[str, Tuple[str, str]] = MappingProxyType({
     "console.anthropic.com":    ("anthropic",   "ANTHROPIC_API_KEY"),
     "platform.openai.com":      ("openai",      "OPENAI_API_KEY"),
     "console.groq.com":         ("groq",        "GROQ_API_KEY"),
@@ -86,10 +96,10 @@ DOMAIN_MAP: Dict[str, Tuple[str, str]] = {
     "cloud.digitalocean.com":   ("digitalocean","DIGITALOCEAN_TOKEN"),
     "vercel.com":               ("vercel",      "VERCEL_TOKEN"),
     "app.supabase.com":         ("supabase",    "SUPABASE_KEY"),
-}
+})
 
 # Default category for each provider type
-PROVIDER_CATEGORY: Dict[str, str] = {
+PROVIDER_CATEGORY: Mapping[str, str] = MappingProxyType({
     "anthropic": "llm", "openai": "llm", "groq": "llm", "openrouter": "llm",
     "mistral": "llm", "huggingface": "llm", "replicate": "llm", "xai": "llm",
     "perplexity": "llm", "nvidia": "llm", "google": "llm",
@@ -97,7 +107,7 @@ PROVIDER_CATEGORY: Dict[str, str] = {
     "stripe": "payments", "stripe-test": "payments", "sendgrid": "email",
     "aws": "cloud", "gcp": "cloud", "azure": "cloud", "digitalocean": "cloud",
     "cloudflare": "cloud", "vercel": "cloud", "supabase": "cloud",
-}
+})
 
 
 @dataclass
@@ -111,6 +121,10 @@ class GrabResult:
     category: str = "llm"
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
+    # masked_key shows this many leading/trailing characters (not dataclass fields)
+    _MASK_HEAD = 8
+    _MASK_TAIL = 4
+
     def save(self, base_dir: str | Path = "~/.getv") -> Path:
         """Save to getv profile."""
         from getv.profile import ProfileManager
@@ -123,14 +137,15 @@ class GrabResult:
         data["_GRABBED_AT"] = self.timestamp
 
         pm.set(self.category, self.provider, data)
-        base = Path(base_dir).expanduser().resolve()
-        return base / self.category / f"{self.provider}.env"
+        return pm.base_dir / self.category / f"{self.provider}.env"
 
-    @property
+    @cached_property
     def masked_key(self) -> str:
-        if len(self.key) > 12:
-            return self.key[:8] + "..." + self.key[-4:]
-        return self.key[:4] + "..."
+        # Computed once; results are not edited after detection
+        k = self.key
+        if len(k) > self._MASK_HEAD + self._MASK_TAIL:
+            return f"{k[:self._MASK_HEAD]}...{k[-self._MASK_TAIL:]}"
+        return f"{k[:4]}..."
 
 
 class ClipboardGrab:
@@ -175,10 +190,8 @@ class ClipboardGrab:
 
         Returns (provider, env_var, domain) or None.
         """
-        for prefix, provider, env_var, domain in PREFIX_RULES:
-            if key.startswith(prefix):
-                return provider, env_var, domain
-        return None
+        m = _PREFIX_RE.match(key)
+        return _BY_PREFIX[m.group(0)] if m else None
 
     @staticmethod
     def looks_like_api_key(text: str) -> bool:
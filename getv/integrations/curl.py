@@ -52,10 +52,10 @@ class CurlEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category(category)
-        store = pm.get(category, profile_name)
-        if store is None:
+        data = pm.get_dict_or_none(category, profile_name)
+        if data is None:
             raise FileNotFoundError(f"Profile not found: {category}/{profile_name}")
-        return cls(store.as_dict())
+        return cls(data)
 
     def command(self, url: str, method: str = "GET",
                 data: Optional[str] = None,
@@ -41,25 +41,21 @@ class DockerEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category(category)
-        store = pm.get(category, profile_name)
-        if store is None:
+        data = pm.get_dict_or_none(category, profile_name)
+        if data is None:
             raise FileNotFoundError(f"Profile not found: {category}/{profile_name}")
-        return cls(store.as_dict())
+        return cls(data)
 
     @classmethod
     def from_profiles(cls, base_dir: str | Path = "~/.getv", **profiles: Optional[str]) -> "DockerEnv":
         """Merge multiple profiles into one Docker env."""
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
-        data: Dict[str, str] = {}
         for category, name in profiles.items():
-            if name is None:
-                continue
-            pm.add_category(category)
-            store = pm.get(category, name)
-            if store:
-                data.update(store.as_dict())
-        return cls(data)
+            if name is not None:
+                pm.add_category(category)
+        # Applied straight from the parse cache, no per-profile copy
+        return cls(pm.merge_profiles_inplace({}, **profiles))
 
     def write_env_file(self, path: str | Path) -> Path:
         """Write a Docker-compatible env file (KEY=VALUE, no quotes)."""
@@ -26,6 +26,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from getv.integrations import DATACLASS_KWARGS
 from getv.store import EnvStore
 
 # Canonical provider → env key mapping (shared across all wronai projects)
@@ -57,7 +58,7 @@ DEFAULT_MODELS: Dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_KWARGS)
 class LiteLLMEnv:
     """Resolved LiteLLM environment from a getv profile."""
     model: str = ""
@@ -75,16 +76,15 @@ class LiteLLMEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category("llm")
-        store = pm.get("llm", profile_name)
-        if store is None:
+        data = pm.get_dict_or_none("llm", profile_name)
+        if data is None:
             raise FileNotFoundError(f"LLM profile not found: {profile_name}")
-        data = store.as_dict()
         return cls.from_dict(data)
 
     @classmethod
     def from_env_file(cls, path: str | Path) -> "LiteLLMEnv":
         """Load from a specific .env file."""
-        store = EnvStore(path, auto_create=False)
+        store = EnvStore(path, auto_create=False, readonly=True)
         return cls.from_dict(store.as_dict())
 
     @classmethod
@@ -149,10 +149,7 @@ class LiteLLMEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category("llm")
-        result: Dict[str, bool] = {}
-        for name, store in pm.list("llm"):
-            result[name] = bool(store.get("LLM_MODEL"))
-        return result
+        return {name: pm.has_key("llm", name, "LLM_MODEL") for name in pm.list_names("llm")}
 
     @staticmethod
     def default_model(provider: str) -> str:
@@ -17,6 +17,7 @@ Or load profiles as env tags::
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, Optional, Tuple
 
 
@@ -39,13 +40,19 @@ def patch_nfo_redaction(visible_chars: int = 4) -> bool:
 
     from getv.security import is_sensitive_key as getv_is_sensitive, mask_value
 
-    # Save originals for combined detection
-    _orig_is_sensitive = nfo_redact.is_sensitive_key
+    # Save originals for combined detection; when patching again, wrap nfo's
+    # own function rather than our previous (cached) wrapper
+    _orig_is_sensitive = getattr(nfo_redact.is_sensitive_key, "_getv_original",
+                                 nfo_redact.is_sensitive_key)
 
+    # Log redaction sees the same handful of key names over and over
+    @functools.lru_cache(maxsize=2048)
     def _combined_is_sensitive(key: str) -> bool:
         """Use both getv and nfo patterns for maximum coverage."""
         return getv_is_sensitive(key) or _orig_is_sensitive(key)
 
+    _combined_is_sensitive._getv_original = _orig_is_sensitive
+
     def _getv_redact_value(value: str, visible_chars: int = visible_chars) -> str:
         """Use getv's mask_value style (show first N chars + ***)."""
         if not value:
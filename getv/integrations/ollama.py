@@ -27,14 +27,19 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from getv.integrations import DATACLASS_KWARGS
 
-@dataclass
+
+@dataclass(**DATACLASS_KWARGS)
 class OllamaEnv:
     """Ollama configuration from a getv profile."""
+    _DEFAULT_NUM_CTX = 4096
+    _DEFAULT_TEMPERATURE = 0.7
+
     base_url: str = "http://localhost:11434"
     model: str = "llama3.2"
-    num_ctx: int = 4096
-    temperature: float = 0.7
+    num_ctx: int = _DEFAULT_NUM_CTX
+    temperature: float = _DEFAULT_TEMPERATURE
     host: str = ""
 
     @classmethod
@@ -43,25 +48,28 @@ class OllamaEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category("ollama")
-        store = pm.get("ollama", profile_name)
-        if store is None:
+        data = pm.get_dict_or_none("ollama", profile_name)
+        if data is None:
             # Try llm category
             pm.add_category("llm")
-            store = pm.get("llm", profile_name)
-        if store is None:
+            data = pm.get_dict_or_none("llm", profile_name)
+        if data is None:
             raise FileNotFoundError(f"Ollama profile not found: {profile_name}")
-        return cls.from_dict(store.as_dict())
+        return cls.from_dict(data)
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "OllamaEnv":
         model = data.get("OLLAMA_MODEL", data.get("LLM_MODEL", "llama3.2"))
         if model.startswith("ollama/"):
             model = model[len("ollama/"):]
+        # Only parse numbers when the profile overrides them
+        num_ctx_raw = data.get("OLLAMA_NUM_CTX") or data.get("NUM_CTX")
+        temperature_raw = data.get("OLLAMA_TEMPERATURE") or data.get("TEMPERATURE")
         return cls(
             base_url=data.get("OLLAMA_API_BASE", data.get("OLLAMA_URL", "http://localhost:11434")),
             model=model,
-            num_ctx=int(data.get("OLLAMA_NUM_CTX", data.get("NUM_CTX", "4096"))),
-            temperature=float(data.get("OLLAMA_TEMPERATURE", data.get("TEMPERATURE", "0.7"))),
+            num_ctx=int(num_ctx_raw) if num_ctx_raw else cls._DEFAULT_NUM_CTX,
+            temperature=float(temperature_raw) if temperature_raw else cls._DEFAULT_TEMPERATURE,
             host=data.get("OLLAMA_HOST", ""),
         )
 
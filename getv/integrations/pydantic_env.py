@@ -45,11 +45,11 @@ def load_profile_into_env(category: str, profile_name: str,
     from getv.profile import ProfileManager
     pm = ProfileManager(base_dir)
     pm.add_category(category)
-    store = pm.get(category, profile_name)
-    if store is None:
+    data = pm.get_dict_or_none(category, profile_name)
+    if data is None:
         return {}
     applied: Dict[str, str] = {}
-    for k, v in store.as_dict().items():
+    for k, v in data.items():
         if override or k not in os.environ:
             os.environ[k] = v
             applied[k] = v
@@ -69,14 +69,11 @@ def profile_overrides(settings_cls: Type[T],
     """
     from getv.profile import ProfileManager
     pm = ProfileManager(base_dir)
-    data: Dict[str, str] = {}
     for category, name in profiles.items():
-        if name is None:
-            continue
-        pm.add_category(category)
-        store = pm.get(category, name)
-        if store:
-            data.update(store.as_dict())
+        if name is not None:
+            pm.add_category(category)
+    # Applied straight from the parse cache, no per-profile copy
+    data = pm.merge_profiles_inplace({}, **profiles)
 
     # Map env var names to pydantic field names
     try:
@@ -20,10 +20,14 @@ from __future__ import annotations
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from getv.integrations import DATACLASS_KWARGS
 
-@dataclass
+_HOSTKEY_OPTS = ("-o", "StrictHostKeyChecking=no")
+
+
+@dataclass(**DATACLASS_KWARGS)
 class SSHEnv:
     """SSH connection parameters from a getv device profile."""
     host: str = ""
@@ -38,10 +42,10 @@ class SSHEnv:
         from getv.profile import ProfileManager
         pm = ProfileManager(base_dir)
         pm.add_category("devices")
-        store = pm.get("devices", profile_name)
-        if store is None:
+        data = pm.get_dict_or_none("devices", profile_name)
+        if data is None:
             raise FileNotFoundError(f"Device profile not found: {profile_name}")
-        return cls.from_dict(store.as_dict())
+        return cls.from_dict(data)
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "SSHEnv":
@@ -57,51 +61,31 @@ class SSHEnv:
         """user@host format."""
         return f"{self.user}@{self.host}"
 
+    def _base_args(self, tool: str, port_flag: str) -> Tuple[str, ...]:
+        """Shared argv head: [sshpass -p PW] tool [-i KEY] PORT_FLAG PORT -o ..."""
+        auth = ("sshpass", "-p", self.password) if self.password and not self.key_file else ()
+        key = ("-i", self.key_file) if self.key_file else ()
+        return (*auth, tool, *key, port_flag, str(self.port), *_HOSTKEY_OPTS)
+
     def command(self, remote_cmd: str = "") -> List[str]:
         """Build a full ssh command line as list of args.
 
         Uses sshpass if password is set and no key_file.
         """
-        cmd: List[str] = []
-        if self.password and not self.key_file:
-            cmd.extend(["sshpass", "-p", self.password])
-        cmd.append("ssh")
-        if self.key_file:
-            cmd.extend(["-i", self.key_file])
-        cmd.extend(["-p", str(self.port)])
-        cmd.extend(["-o", "StrictHostKeyChecking=no"])
-        cmd.append(self.connection_string())
+        cmd = [*self._base_args("ssh", "-p"), self.connection_string()]
         if remote_cmd:
             cmd.append(remote_cmd)
         return cmd
 
     def scp_to(self, local_path: str, remote_path: str) -> List[str]:
         """Build scp command to upload a file."""
-        cmd: List[str] = []
-        if self.password and not self.key_file:
-            cmd.extend(["sshpass", "-p", self.password])
-        cmd.append("scp")
-        if self.key_file:
-            cmd.extend(["-i", self.key_file])
-        cmd.extend(["-P", str(self.port)])
-        cmd.extend(["-o", "StrictHostKeyChecking=no"])
-        cmd.append(local_path)
-        cmd.append(f"{self.connection_string()}:{remote_path}")
-        return cmd
+        return [*self._base_args("scp", "-P"), local_path,
+                f"{self.connection_string()}:{remote_path}"]
 
     def scp_from(self, remote_path: str, local_path: str) -> List[str]:
         """Build scp command to download a file."""
-        cmd: List[str] = []
-        if self.password and not self.key_file:
-            cmd.extend(["sshpass", "-p", self.password])
-        cmd.append("scp")
-        if self.key_file:
-            cmd.extend(["-i", self.key_file])
-        cmd.extend(["-P", str(self.port)])
-        cmd.extend(["-o", "StrictHostKeyChecking=no"])
-        cmd.append(f"{self.connection_string()}:{remote_path}")
-        cmd.append(local_path)
-        return cmd
+        return [*self._base_args("scp", "-P"),
+                f"{self.connection_string()}:{remote_path}", local_path]
 
     def run(self, remote_cmd: str, capture: bool = False, timeout: int = 30) -> subprocess.CompletedProcess:
         """Execute a remote command via SSH."""
@@ -25,14 +25,53 @@ Usage::
 from __future__ import annotations
 
 import os
+import re
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from getv.formats import shell_quote, to_shell_export
+from getv.profile import clear_base_dir_cache, expand_base_dir
+from getv.store import clear_read_cache, read_env_cached
+
+# Same "needs quoting" test as shlex.quote
+_SHELL_UNSAFE_RE = re.compile(r"[^\w@%+=:,./-]", re.ASCII)
+
+
+def _load_profile(base_dir: str | Path, category: str, name: str) -> Optional[Dict[str, str]]:
+    """Read a profile's vars through the shared parse cache. None if missing.
+
+    The returned dict is the cached one — read it, don't mutate it.
+    """
+    # The base dir's realpath() is memoized; the profile file itself is
+    # not resolved, so stat() and read follow a retargeted symlink
+    path = expand_base_dir(base_dir) / category / f"{name}.env"
+    try:
+        return read_env_cached(path, copy=False, resolved=True)
+    except FileNotFoundError:
+        return None
+
+
+def _load_one(base_dir: str | Path, category: str, name: Optional[str],
+              inherit: bool = True) -> Dict[str, str]:
+    """Single-profile build_env(): os.environ (if inherit) overlaid with one profile."""
+    data = _load_profile(base_dir, category, name) if name is not None else None
+    if inherit:
+        # One allocation; os.environ is read fresh every call (no snapshot), so
+        # variables set after import (e.g. by activate()) are inherited too
+        return {**os.environ, **data} if data else dict(os.environ)
+    return dict(data) if data else {}
+
 
 class SubprocessEnv:
     """Run subprocesses with getv profile env vars injected."""
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached base-dir paths and parses (mainly for tests)."""
+        clear_base_dir_cache()
+        clear_read_cache()
+
     @staticmethod
     def build_env(base_dir: str | Path = "~/.getv", inherit: bool = True,
                   **profiles: Optional[str]) -> Dict[str, str]:
@@ -43,17 +82,14 @@ class SubprocessEnv:
             inherit: If True, start from os.environ and overlay profile vars.
             **profiles: category=profile_name pairs (e.g., devices="rpi3", llm="groq").
         """
-        from getv.profile import ProfileManager
-        pm = ProfileManager(base_dir)
         env = dict(os.environ) if inherit else {}
 
         for category, name in profiles.items():
             if name is None:
                 continue
-            pm.add_category(category)
-            store = pm.get(category, name)
-            if store:
-                env.update(store.as_dict())
+            data = _load_profile(base_dir, category, name)
+            if data:
+                env.update(data)
         return env
 
     @staticmethod
@@ -61,7 +97,7 @@ class SubprocessEnv:
             base_dir: str | Path = "~/.getv", capture: bool = False,
             timeout: Optional[int] = None, **kwargs) -> subprocess.CompletedProcess:
         """Run a command with a single profile's env vars injected."""
-        env = SubprocessEnv.build_env(base_dir=base_dir, **{category: profile_name})
+        env = _load_one(base_dir, category, profile_name)
         return subprocess.run(cmd, env=env, capture_output=capture, text=True,
                               timeout=timeout, **kwargs)
 
@@ -80,18 +116,10 @@ class SubprocessEnv:
 
         Usage in shell: eval $(getv export llm groq --format shell)
         """
-        from getv.profile import ProfileManager
-        pm = ProfileManager(base_dir)
-        pm.add_category(category)
-        store = pm.get(category, profile_name)
-        if store is None:
+        data = _load_profile(base_dir, category, profile_name)
+        if data is None:
             return ""
-        lines = []
-        for k, v in sorted(store.as_dict().items()):
-            # Escape single quotes in values
-            escaped = v.replace("'", "'\\''")
-            lines.append(f"export {k}='{escaped}'")
-        return "\n".join(lines)
+        return to_shell_export(data)
 
     @staticmethod
     def env_inline(category: str, profile_name: str,
@@ -100,14 +128,13 @@ class SubprocessEnv:
 
         Usage: $(getv inline llm groq) ollama run llama3.2
         """
-        from getv.profile import ProfileManager
-        pm = ProfileManager(base_dir)
-        pm.add_category(category)
-        store = pm.get(category, profile_name)
-        if store is None:
+        data = _load_profile(base_dir, category, profile_name)
+        if data is None:
             return ""
         parts = []
-        for k, v in sorted(store.as_dict().items()):
-            escaped = v.replace("'", "'\\''")
-            parts.append(f"{k}='{escaped}'")
+        for k, v in sorted(data.items()):
+            if v and not _SHELL_UNSAFE_RE.search(v):
+                parts.append(f"{k}={v}")
+                continue
+            parts.append(f"{k}={shell_quote(v)}")
         return " ".join(parts)
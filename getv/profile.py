@@ -2,13 +2,180 @@
 
 from __future__ import annotations
 
+import functools
+import io
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from getv.store import EnvStore
+from getv.store import (
+    EnvStore, _decode, _forget_cached_under, _parse_env, read_env_cached,
+)
 from getv.security import mask_dict
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_absolute(path: Path) -> Path:
+    return path.resolve()
+
+
+def expand_base_dir(base_dir: str | Path) -> Path:
+    """Expand ``~`` and resolve a base directory to an absolute Path.
+
+    Absolute paths are memoized, so repeated managers for the same home
+    skip the realpath() walk; ProfileManager.invalidate() with no category
+    forgets them (e.g. after a symlinked home was retargeted).  Relative
+    paths depend on the cwd and are resolved on every call.
+    """
+    path = Path(base_dir).expanduser()
+    if path.is_absolute():
+        return _resolve_absolute(path)
+    return path.resolve()
+
+
+def clear_base_dir_cache() -> None:
+    """Forget memoized expand_base_dir() results."""
+    _resolve_absolute.cache_clear()
+
+
+# Category directories (under a resolved base dir) already created in this
+# process, shared by all managers so short-lived ones (integrations,
+# GrabResult.save) skip the mkdir.  Entries are dropped when a lookup finds
+# the directory gone; EnvStore.save() recreates a missing parent regardless.
+_MKDIR_DONE: Set[Path] = set()
+
+# list() reads this many changed profiles in parallel (and only bothers above it)
+_PARALLEL_READ_MIN = 8
+
+
+def _read_text_or_none(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _env_paths(directory: Path) -> List[Path]:
+    """Sorted ``*.env`` files in directory, from a single os.scandir() pass."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(e.path) for e in entries
+            if e.name.endswith(".env") and e.is_file()
+        )
+
+
+def _read_texts(paths: List[Path]) -> List[Optional[str]]:
+    """Read files in order, overlapping the reads when there are many."""
+    if len(paths) > _PARALLEL_READ_MIN:
+        # I/O-bound: overlap the reads (helps on network homedirs), parse in the caller
+        with ThreadPoolExecutor(max_workers=_PARALLEL_READ_MIN) as pool:
+            return list(pool.map(_read_text_or_none, paths))
+    return [_read_text_or_none(f) for f in paths]
+
+
+# One cached profile in ProfileManager.list(): (mtime_ns, size, resolved path, raw text, parsed vars)
+_ListEntry = Tuple[int, int, Path, str, Dict[str, str]]
+
+
+class ZipBackend:
+    """Keep a category's profiles as entries of one ``<category>/profiles.zip``.
+
+    Meant for homes with thousands of profiles, where opening one file per
+    profile dominates: the archive is read with a single open() and each
+    entry is only decompressed and parsed when first asked for.  Writes
+    rewrite the archive (temp file + os.replace()), once per call, so group
+    changes with ProfileManager.set_many().  Comments are not kept.
+
+    Usually used through ``ProfileManager(base_dir, backend="zip")``.
+    """
+
+    __slots__ = ("base_dir", "_cache")
+
+    ARCHIVE = "profiles.zip"
+
+    def __init__(self, base_dir: Path) -> None:
+        self.base_dir = base_dir
+        # category -> (mtime_ns, size, archive, {name: parsed vars})
+        self._cache: Dict[str, Tuple[int, int, zipfile.ZipFile, Dict[str, Dict[str, str]]]] = {}
+
+    def _archive_path(self, category: str) -> Path:
+        return self.base_dir / category / self.ARCHIVE
+
+    def _open(self, category: str):
+        """Cache entry for the category's current archive, or None if there is none."""
+        path = self._archive_path(category)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._cache.pop(category, None)
+            return None
+        cached = self._cache.get(category)
+        if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            # Whole archive in memory: no file handle outlives this call
+            archive = zipfile.ZipFile(io.BytesIO(path.read_bytes()))
+            cached = (st.st_mtime_ns, st.st_size, archive, {})
+            self._cache[category] = cached
+        return cached
+
+    def names(self, category: str) -> List[str]:
+        """Sorted profile names in a category."""
+        cached = self._open(category)
+        if cached is None:
+            return []
+        return sorted(n[:-4] for n in cached[2].namelist() if n.endswith(".env"))
+
+    def read(self, category: str, name: str) -> Optional[Dict[str, str]]:
+        """Parsed profile, or None if missing.  The dict is shared: don't mutate it."""
+        cached = self._open(category)
+        if cached is None:
+            return None
+        parsed = cached[3].get(name)
+        if parsed is None:
+            try:
+                raw = cached[2].read(f"{name}.env")
+            except KeyError:
+                return None
+            parsed = _parse_env(_decode(raw))
+            cached[3][name] = parsed
+        return parsed
+
+    def write(self, category: str, profiles: Dict[str, Dict[str, str]]) -> None:
+        """Merge ``{name: data}`` into existing profiles (like EnvStore.update) and save."""
+        entries = {name: self.read(category, name) for name in self.names(category)}
+        for name, data in profiles.items():
+            entries[name] = {**(entries.get(name) or {}), **data}
+        self._save(category, entries)
+
+    def delete(self, category: str, name: str) -> bool:
+        """Remove a profile. Returns True if it existed."""
+        names = self.names(category)
+        if name not in names:
+            return False
+        self._save(category, {n: self.read(category, n) for n in names if n != name})
+        return True
+
+    def _save(self, category: str, entries: Dict[str, Optional[Dict[str, str]]]) -> None:
+        path = self._archive_path(category)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{self.ARCHIVE}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as archive:
+                for name, data in sorted(entries.items()):
+                    body = "".join(f"{k}={v}\n" for k, v in (data or {}).items())
+                    archive.writestr(f"{name}.env", body)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._cache.pop(category, None)
+
+
 class ProfileValidationError(ValueError):
     """Raised when a profile fails required_keys validation."""
 
@@ -53,11 +220,24 @@ class ProfileManager:
 
         # Merge device + llm profiles on top of a base config
         merged = pm.merge_profiles(base_cfg, device="rpi3", llm="groq")
+
+    With ``backend="zip"`` each category is stored as one archive (see
+    ZipBackend); stores returned by get() are then read-only, use set().
     """
 
-    def __init__(self, base_dir: str | Path = "~/.getv") -> None:
-        self.base_dir = Path(base_dir).expanduser().resolve()
+    __slots__ = ("base_dir", "_categories", "_list_cache", "_key_index", "_zip")
+
+    def __init__(self, base_dir: str | Path = "~/.getv", backend: str = "dir") -> None:
+        if backend not in ("dir", "zip"):
+            raise ValueError(f"Unknown profile backend: {backend}")
+        self.base_dir = expand_base_dir(base_dir)
+        self._zip: Optional[ZipBackend] = ZipBackend(self.base_dir) if backend == "zip" else None
         self._categories: Dict[str, dict] = {}
+        # category -> (dir mtime_ns, sorted profile paths,
+        #              {path: (mtime_ns, size, resolved path, raw text, parsed vars)})
+        self._list_cache: Dict[str, Tuple[int, List[Path], Dict[Path, _ListEntry]]] = {}
+        # category -> (list() store map it was built from, {(key, value): names})
+        self._key_index: Dict[str, Tuple[dict, Dict[Tuple[str, str], List[str]]]] = {}
 
     def add_category(
         self,
@@ -70,31 +250,65 @@ class ProfileManager:
             "required_keys": required_keys or [],
             "defaults": defaults or {},
         }
-        cat_dir = self.base_dir / name
-        cat_dir.mkdir(parents=True, exist_ok=True)
+        self._category_dir(name)
         return self
 
     def _category_dir(self, category: str) -> Path:
         d = self.base_dir / category
-        d.mkdir(parents=True, exist_ok=True)
+        if d not in _MKDIR_DONE:
+            d.mkdir(parents=True, exist_ok=True)
+            _MKDIR_DONE.add(d)
         return d
 
-    def _profile_path(self, category: str, name: str) -> Path:
+    def _read_path(self, category: str, name: str) -> Path:
+        """Profile path for lookups; never creates directories."""
+        return self.base_dir / category / f"{name}.env"
+
+    def _write_path(self, category: str, name: str) -> Path:
+        """Profile path for writes; ensures the category directory exists."""
         return self._category_dir(category) / f"{name}.env"
 
     # ── CRUD ─────────────────────────────────────────────────────────────
 
     def get(self, category: str, name: str) -> Optional[EnvStore]:
-        """Load a profile by category and name. Returns None if not found."""
-        path = self._profile_path(category, name)
-        if not path.exists():
+        """Load a profile by category and name. Returns None if not found.
+
+        Values come from the shared parse cache (see read_env_cached), so
+        an unchanged profile costs one stat.  Each call returns a new store,
+        so edits made to one are not seen by the next get() until saved.
+        """
+        path = self._read_path(category, name)
+        if self._zip is not None:
+            data = self._zip.read(category, name)
+            if data is None:
+                return None
+            return EnvStore._from_text(path, "", readonly=True, data=data)
+        try:
+            path = path.resolve(strict=True)
+            data = read_env_cached(path, copy=False, resolved=True)
+        except FileNotFoundError:
             return None
-        return EnvStore(path, auto_create=False)
+        # Raw text for comment-preserving saves is read by save() itself
+        return EnvStore._from_text(path, None, data=data)
 
     def get_dict(self, category: str, name: str) -> Dict[str, str]:
         """Load profile as a plain dict. Returns {} if not found."""
-        store = self.get(category, name)
-        return store.as_dict() if store else {}
+        data = self.get_dict_or_none(category, name)
+        return {} if data is None else data
+
+    def get_dict_or_none(self, category: str, name: str) -> Optional[Dict[str, str]]:
+        """Load profile as a plain dict. Returns None if not found.
+
+        Served from the shared parse cache (see read_env_cached), so repeated
+        loads of an unchanged profile cost one stat.
+        """
+        if self._zip is not None:
+            data = self._zip.read(category, name)
+            return None if data is None else data.copy()
+        try:
+            return read_env_cached(self._read_path(category, name))
+        except FileNotFoundError:
+            return None
 
     def set(self, category: str, name: str, data: Dict[str, str],
             validate: bool = False) -> EnvStore:
@@ -108,54 +322,237 @@ class ProfileManager:
             missing = self.validate(category, data)
             if missing:
                 raise ProfileValidationError(category, name, missing)
-        path = self._profile_path(category, name)
+        if self._zip is not None:
+            self._zip.write(category, {name: data})
+            self.invalidate(category)
+            return self.get(category, name)
+        path = self._write_path(category, name)
         store = EnvStore(path)
         store.update(data)
         store.save()
+        self.invalidate(category)
         return store
 
+    def set_many(self, profiles: Dict[Tuple[str, str], Dict[str, str]],
+                 validate: bool = False) -> Dict[Tuple[str, str], EnvStore]:
+        """Create or update several profiles at once.
+
+        Args:
+            profiles: ``{(category, name): data}``.
+            validate: If True, check every profile against required_keys
+                      before writing any of them.
+        """
+        if validate:
+            for (category, name), data in profiles.items():
+                missing = self.validate(category, data)
+                if missing:
+                    raise ProfileValidationError(category, name, missing)
+        if self._zip is not None:
+            # One archive rewrite per category
+            by_category: Dict[str, Dict[str, Dict[str, str]]] = {}
+            for (category, name), data in profiles.items():
+                by_category.setdefault(category, {})[name] = data
+            for category, batch in by_category.items():
+                self._zip.write(category, batch)
+                self.invalidate(category)
+            return {key: self.get(*key) for key in profiles}
+        stores: Dict[Tuple[str, str], EnvStore] = {}
+        for (category, name), data in profiles.items():
+            store = EnvStore(self._write_path(category, name))
+            store.update(data)
+            store.save()
+            stores[(category, name)] = store
+        for category in {category for category, _ in profiles}:
+            self.invalidate(category)
+        return stores
+
     def validate(self, category: str, data: Dict[str, str]) -> List[str]:
         """Check data against required_keys for category. Returns list of missing keys."""
-        cat_info = self._categories.get(category, {})
-        required = cat_info.get("required_keys", [])
-        return [k for k in required if k not in data or not data[k]]
+        cat_info = self._categories.get(category)
+        if not cat_info:
+            return []
+        # One lookup per required key (usually a handful) instead of a set
+        # built from every key in data; keeps the required_keys order
+        return [k for k in cat_info["required_keys"] if not data.get(k)]
 
     def delete(self, category: str, name: str) -> bool:
         """Delete a profile. Returns True if it existed."""
-        path = self._profile_path(category, name)
+        if self._zip is not None:
+            deleted = self._zip.delete(category, name)
+            if deleted:
+                self.invalidate(category)
+            return deleted
+        path = self._read_path(category, name)
         if path.exists():
             path.unlink()
+            self.invalidate(category)
             return True
         return False
 
     def exists(self, category: str, name: str) -> bool:
-        return self._profile_path(category, name).exists()
+        if self._zip is not None:
+            return name in self._zip.names(category)
+        return self._read_path(category, name).exists()
+
+    def has_key(self, category: str, name: str, key: str) -> bool:
+        """Check if a profile sets key to a non-empty value.
+
+        Scans the raw lines instead of parsing the whole profile into a dict.
+        """
+        if self._zip is not None:
+            return bool((self._zip.read(category, name) or {}).get(key))
+        path = self._read_path(category, name)
+        if not path.exists():
+            return False
+        needle = key.encode("utf-8")
+        found = False
+        with path.open("rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith(needle):
+                    continue
+                k, sep, value = line.partition(b"=")
+                if not sep or k.strip() != needle:
+                    continue
+                value = value.strip()
+                if len(value) >= 2 and value[:1] == value[-1:] and value[:1] in (b'"', b"'"):
+                    value = value[1:-1]
+                # Keep scanning: like the parser, the last assignment wins
+                found = bool(value)
+        return found
 
     # ── List / Search ────────────────────────────────────────────────────
 
     def list(self, category: str) -> List[Tuple[str, EnvStore]]:
-        """List all profiles in a category as (name, EnvStore) pairs."""
+        """List all profiles in a category as (name, EnvStore) pairs.
+
+        The directory listing is reused while the category directory's mtime
+        is unchanged, and each file is only re-parsed when its mtime or size
+        changes.  Every call returns new store objects, so changes made to
+        one caller's stores are never seen by another; they can be edited
+        and saved like stores from get().
+        """
+        if self._zip is not None:
+            return [(name, self.get(category, name)) for name in self._zip.names(category)]
+        return [
+            (name, EnvStore._from_text(entry[2], entry[3], data=entry[4]))
+            for name, entry in self._list_entries(category)
+        ]
+
+    def _list_entries(self, category: str) -> List[Tuple[str, _ListEntry]]:
+        """Cached (name, entry) pairs for a category, refreshed as list() describes."""
+        scan = self._list_scan(category)
+        if scan is None:
+            return []
+        return self._list_finish(category, scan, _read_texts([f for f, _ in scan[3]]))
+
+    def _list_scan(self, category: str):
+        """Stat a category for list(): ``(dir_mtime, paths, fresh, stale)`` or None.
+
+        ``fresh`` holds reusable cache entries; ``stale`` the (path, stat)
+        pairs that must be re-read.
+        """
         cat_dir = self._category_dir(category)
-        results = []
-        for f in sorted(cat_dir.glob("*.env")):
-            results.append((f.stem, EnvStore(f, auto_create=False)))
-        return results
+        try:
+            dir_mtime = cat_dir.stat().st_mtime_ns
+            cached = self._list_cache.get(category)
+            if cached is not None and cached[0] == dir_mtime:
+                paths, stores = cached[1], cached[2]
+            else:
+                paths = _env_paths(cat_dir)
+                stores = cached[2] if cached is not None else {}
+        except FileNotFoundError:
+            # Removed behind our back since we created it
+            _MKDIR_DONE.discard(cat_dir)
+            self._list_cache.pop(category, None)
+            return None
+
+        fresh: Dict[Path, _ListEntry] = {}
+        stale: List[Tuple[Path, os.stat_result]] = []
+        for f in paths:
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            entry = stores.get(f)
+            if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                stale.append((f, st))
+            else:
+                fresh[f] = entry
+        if not stale and len(fresh) == len(stores):
+            # Nothing changed: keep the same map so indexes built on it stay valid
+            fresh = stores
+        return dir_mtime, paths, fresh, stale
+
+    def _list_finish(self, category: str, scan, texts: List[Optional[str]]) -> List[Tuple[str, _ListEntry]]:
+        """Parse the stale texts read for a _list_scan() result and cache it."""
+        dir_mtime, paths, fresh, stale = scan
+        for (f, st), text in zip(stale, texts):
+            if text is not None:
+                fresh[f] = (st.st_mtime_ns, st.st_size, f.resolve(), text, _parse_env(text))
+        self._list_cache[category] = (dir_mtime, paths, fresh)
+        return [(f.stem, fresh[f]) for f in paths if f in fresh]
+
+    def invalidate(self, category: Optional[str] = None) -> None:
+        """Drop cached list() results for one category, or for all of them.
+
+        Parses of these profiles held by read_env_cached() are dropped too.
+        Without a category, memoized expand_base_dir() results are also
+        forgotten, so new managers re-resolve symlinked base directories.
+        """
+        _forget_cached_under(self.base_dir if category is None else self.base_dir / category)
+        if category is None:
+            clear_base_dir_cache()
+            self._list_cache.clear()
+            self._key_index.clear()
+        else:
+            self._list_cache.pop(category, None)
+            self._key_index.pop(category, None)
 
     def list_names(self, category: str) -> List[str]:
-        """List profile names in a category."""
-        return [name for name, _ in self.list(category)]
+        """List profile names in a category.
+
+        Reuses list()'s directory listing while the directory is unchanged.
+        """
+        if self._zip is not None:
+            return self._zip.names(category)
+        cat_dir = self._category_dir(category)
+        cached = self._list_cache.get(category)
+        try:
+            if cached is not None and cached[0] == cat_dir.stat().st_mtime_ns:
+                return [f.stem for f in cached[1]]
+            return [f.stem for f in _env_paths(cat_dir)]
+        except FileNotFoundError:
+            _MKDIR_DONE.discard(cat_dir)
+            return []
 
     def list_categories(self) -> List[str]:
         """List all registered categories."""
         return list(self._categories.keys())
 
     def list_all(self) -> Dict[str, List[Tuple[str, Dict[str, str]]]]:
-        """Return all categories with their profiles as dicts."""
+        """Return all categories with their profiles as dicts.
+
+        Changed profiles from every category are read in one batch, so
+        many small categories still get overlapped reads.
+        """
+        if self._zip is not None:
+            return {
+                cat: [(name, store.as_dict()) for name, store in self.list(cat)]
+                for cat in self._categories
+            }
+        scans = {cat: self._list_scan(cat) for cat in self._categories}
+        texts = _read_texts([f for scan in scans.values() if scan for f, _ in scan[3]])
         result = {}
-        for cat in self._categories:
-            result[cat] = [
-                (name, store.as_dict()) for name, store in self.list(cat)
-            ]
+        offset = 0
+        for cat, scan in scans.items():
+            if scan is None:
+                result[cat] = []
+                continue
+            count = len(scan[3])
+            entries = self._list_finish(cat, scan, texts[offset:offset + count])
+            offset += count
+            result[cat] = [(name, entry[4].copy()) for name, entry in entries]
         return result
 
     # ── Merge / Overlay ──────────────────────────────────────────────────
@@ -176,24 +573,53 @@ class ProfileManager:
                 llm="groq",
             )
         """
-        result = dict(base)
+        return self.merge_profiles_inplace(dict(base), **profiles)
+
+    def merge_profiles_inplace(
+        self,
+        base: Dict[str, str],
+        **profiles: Optional[str],
+    ) -> Dict[str, str]:
+        """Like merge_profiles(), but updates and returns ``base`` itself.
+
+        Destructive: the caller's dict is modified.  Each profile is
+        applied straight from the parse cache, with no per-profile copy.
+        """
         for category, name in profiles.items():
             if name is None:
                 continue
-            store = self.get(category, name)
-            if store:
-                result.update(store.as_dict())
-        return result
+            if self._zip is not None:
+                base.update(self._zip.read(category, name) or {})
+                continue
+            try:
+                base.update(read_env_cached(self._read_path(category, name), copy=False))
+            except FileNotFoundError:
+                continue
+        return base
 
     # ── Search across profiles ───────────────────────────────────────────
 
     def find_by_key(self, category: str, key: str, value: str) -> List[str]:
-        """Find profile names where key matches value."""
-        matches = []
-        for name, store in self.list(category):
-            if store.get(key) == value:
-                matches.append(name)
-        return matches
+        """Find profile names where key matches value.
+
+        Answered from a ``(key, value) -> names`` index over the category,
+        rebuilt only when list() sees a profile change.
+        """
+        if self._zip is not None:
+            return [name for name, store in self.list(category) if store.get(key) == value]
+        entries = self._list_entries(category)
+        cached = self._list_cache.get(category)
+        if cached is None:
+            return []
+        indexed = self._key_index.get(category)
+        if indexed is None or indexed[0] is not cached[2]:
+            index: Dict[Tuple[str, str], List[str]] = {}
+            for name, entry in entries:
+                for item in entry[4].items():
+                    index.setdefault(item, []).append(name)
+            indexed = (cached[2], index)
+            self._key_index[category] = indexed
+        return list(indexed[1].get((key, value), ()))
 
     # ── Diff / Copy ────────────────────────────────────────────────────
 
@@ -204,13 +630,11 @@ class ProfileManager:
         """
         a = self.get_dict(category, name_a)
         b = self.get_dict(category, name_b)
-        all_keys = sorted(set(a) | set(b))
-        result: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
-        for k in all_keys:
-            va, vb = a.get(k), b.get(k)
-            if va != vb:
-                result[k] = (va, vb)
-        return result
+        # Keys on one side only, plus shared keys whose values differ;
+        # only this (usually small) set gets sorted
+        changed = a.keys() ^ b.keys()
+        changed.update(k for k in a.keys() & b.keys() if a[k] != b[k])
+        return {k: (a.get(k), b.get(k)) for k in sorted(changed)}
 
     def copy(self, src_category: str, src_name: str,
              dst_category: str, dst_name: str) -> EnvStore:
@@ -227,11 +651,13 @@ class ProfileManager:
         """Return profiles as list of dicts with masked sensitive values, suitable for table display."""
         rows = []
         for name, store in self.list(category):
-            data = mask_dict(store.as_dict())
-            row = {"name": name, **data}
             if columns:
-                row = {k: row.get(k, "") for k in ["name"] + columns}
-            rows.append(row)
+                # Only the requested values that are set get masked; missing
+                # columns stay "" so they don't look like a hidden secret
+                masked = mask_dict({k: store[k] for k in columns if k != "name" and k in store})
+                rows.append({"name": name, **{k: masked.get(k, "") for k in columns if k != "name"}})
+            else:
+                rows.append({"name": name, **mask_dict(store.as_dict())})
         return rows
 
     def __repr__(self) -> str:
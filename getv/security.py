@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import base64
+import functools
+import os
 import re
-from typing import Dict, Optional, Set
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional, Set, Union
 
 # Keys whose values should be masked in logs/display
 _SENSITIVE_PATTERNS: Set[str] = {
@@ -16,72 +20,158 @@ _SENSITIVE_PATTERNS: Set[str] = {
     "CREDENTIAL", "CREDENTIALS",
 }
 
+# One alternation over all patterns, matched against upper-cased key names
+# (the patterns are uppercase), so a lookup is a single C-level scan
 _SENSITIVE_RE = re.compile(
-    r"(" + "|".join(re.escape(p) for p in _SENSITIVE_PATTERNS) + r")",
-    re.IGNORECASE,
+    "|".join(re.escape(p) for p in sorted(_SENSITIVE_PATTERNS, key=len, reverse=True))
 )
 
 
+@functools.lru_cache(maxsize=1024)
 def is_sensitive_key(key: str) -> bool:
     """Check if a key name likely holds a secret value."""
-    return bool(_SENSITIVE_RE.search(key))
+    return _SENSITIVE_RE.search(key.upper()) is not None
+
+
+# Suffix shown in place of the hidden part of a masked value
+_MASK = "***"
 
 
 def mask_value(value: str, visible_chars: int = 4) -> str:
     """Mask a sensitive value, showing only first N chars."""
     if len(value) <= visible_chars:
-        return "***"
-    return value[:visible_chars] + "***"
+        return _MASK
+    return value[:visible_chars] + _MASK
 
 
 def mask_dict(data: Dict[str, str], visible_chars: int = 4) -> Dict[str, str]:
     """Return a copy with sensitive values masked."""
-    result = {}
-    for key, value in data.items():
-        if is_sensitive_key(key):
-            result[key] = mask_value(value, visible_chars)
-        else:
-            result[key] = value
-    return result
+    # One regex pass over all key names; most categories hold no secrets at all.
+    # Upper-cased exactly as in is_sensitive_key, so both agree on every key.
+    if not _SENSITIVE_RE.search("\x00".join(data).upper()):
+        return dict(data)
+    # mask_value() inlined: v[:n] + _MASK, or _MASK when too short to show a prefix
+    sensitive = is_sensitive_key
+    return {
+        k: ((v[:visible_chars] + _MASK if len(v) > visible_chars else _MASK)
+            if sensitive(k) else v)
+        for k, v in data.items()
+    }
 
 
 # ── Encryption (optional, requires cryptography) ────────────────────────
 
+_FERNET_CLS = None
+
+
+def _fernet_cls():
+    """Import cryptography's Fernet class once, on first use."""
+    global _FERNET_CLS
+    if _FERNET_CLS is None:
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
+        _FERNET_CLS = Fernet
+    return _FERNET_CLS
+
+
+_AESGCM_CLS = None
+
+# Tokens written by the AES-GCM cipher; anything else is a legacy Fernet token
+_GCM_PREFIX = "gcm:"
+_GCM_NONCE_SIZE = 12
+# HKDF label separating the AES-GCM key from the Fernet keys of the same key file
+_GCM_KEY_INFO = b"getv-aesgcm-v1"
+
+
+def _aesgcm_cls():
+    """Import cryptography's AESGCM class once, on first use."""
+    global _AESGCM_CLS
+    if _AESGCM_CLS is None:
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
+        _AESGCM_CLS = AESGCM
+    return _AESGCM_CLS
+
+
+def _derive_gcm_key(raw: bytes) -> bytes:
+    """HKDF-SHA256 the decoded key file bytes into the AES-256-GCM key."""
+    try:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    except ImportError:
+        raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_GCM_KEY_INFO).derive(raw)
+
+
+class _Cipher:
+    """Encrypt with AES-256-GCM; decrypt both AES-GCM and older Fernet tokens.
+
+    Keys stay in Fernet's format (URL-safe base64 of 32 random bytes), so
+    existing key files keep working and still open values encrypted before
+    the switch.  The AES-256 key is derived from the decoded bytes with
+    HKDF-SHA256 under its own label, so the GCM key never equals Fernet's
+    signing/encryption keys made from the same material.
+    """
+
+    __slots__ = ("_key", "_aead", "_fernet")
+
+    def __init__(self, key: bytes) -> None:
+        raw = base64.urlsafe_b64decode(key)
+        if len(raw) != 32:
+            raise ValueError("Encryption key must be 32 url-safe base64-encoded bytes.")
+        self._key = key
+        self._aead = _aesgcm_cls()(_derive_gcm_key(raw))
+        self._fernet = None
+
+    def encrypt(self, value: str) -> str:
+        nonce = os.urandom(_GCM_NONCE_SIZE)
+        sealed = self._aead.encrypt(nonce, value.encode("utf-8"), None)
+        return _GCM_PREFIX + base64.urlsafe_b64encode(nonce + sealed).decode("ascii")
+
+    def decrypt(self, token: str) -> str:
+        if not token.startswith(_GCM_PREFIX):
+            if self._fernet is None:
+                self._fernet = _fernet_cls()(self._key)
+            return self._fernet.decrypt(token.encode("ascii")).decode("utf-8")
+        from cryptography.exceptions import InvalidTag
+        from cryptography.fernet import InvalidToken
+        try:
+            raw = base64.urlsafe_b64decode(token[len(_GCM_PREFIX):])
+            plain = self._aead.decrypt(raw[:_GCM_NONCE_SIZE], raw[_GCM_NONCE_SIZE:], None)
+        except (InvalidTag, ValueError):
+            # Same error as a bad Fernet token, whichever format was stored
+            raise InvalidToken from None
+        return plain.decode("utf-8")
+
+
 def encrypt_value(value: str, key: bytes) -> str:
-    """Encrypt a string value using Fernet symmetric encryption.
+    """Encrypt a string value using AES-256-GCM symmetric encryption.
 
     Args:
         value: Plaintext string to encrypt.
-        key: 32-byte URL-safe base64-encoded Fernet key.
+        key: 32-byte URL-safe base64-encoded key (see generate_key()).
 
     Returns:
         Encrypted token as a string.
     """
-    try:
-        from cryptography.fernet import Fernet
-    except ImportError:
-        raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
-    f = Fernet(key)
-    return f.encrypt(value.encode("utf-8")).decode("ascii")
+    return _Cipher(key).encrypt(value)
 
 
 def decrypt_value(token: str, key: bytes) -> str:
-    """Decrypt a Fernet-encrypted token back to plaintext."""
-    try:
-        from cryptography.fernet import Fernet
-    except ImportError:
-        raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
-    f = Fernet(key)
-    return f.decrypt(token.encode("ascii")).decode("utf-8")
+    """Decrypt a token made by encrypt_value (AES-GCM, or Fernet from older versions).
+
+    Raises ``cryptography.fernet.InvalidToken`` for a wrong key or a damaged token.
+    """
+    return _Cipher(key).decrypt(token)
 
 
 def generate_key() -> bytes:
-    """Generate a new Fernet encryption key."""
-    try:
-        from cryptography.fernet import Fernet
-    except ImportError:
-        raise ImportError("Install getv[crypto] for encryption: pip install getv[crypto]")
-    return Fernet.generate_key()
+    """Generate a new encryption key (Fernet key format)."""
+    return _fernet_cls().generate_key()
 
 
 def encrypt_store(data: Dict[str, str], key: bytes, only_sensitive: bool = True) -> Dict[str, str]:
@@ -96,20 +186,79 @@ def encrypt_store(data: Dict[str, str], key: bytes, only_sensitive: bool = True)
         Dict with encrypted values prefixed with 'ENC:'.
     """
     result = {}
+    f = None  # built on the first value that needs it
     for k, v in data.items():
         if only_sensitive and not is_sensitive_key(k):
             result[k] = v
         else:
-            result[k] = f"ENC:{encrypt_value(v, key)}"
+            if f is None:
+                f = _Cipher(key)
+            result[k] = f"ENC:{f.encrypt(v)}"
     return result
 
 
-def decrypt_store(data: Dict[str, str], key: bytes) -> Dict[str, str]:
-    """Decrypt values that were encrypted by encrypt_store."""
+class LazyDecryptDict(MutableMapping):
+    """Mapping over encrypt_store() output that decrypts ``ENC:`` values on first read.
+
+    Each value is decrypted at most once and then kept in plaintext;
+    values assigned later are stored as given.  Reading everything
+    (``dict(d)``, ``d == other``) decrypts everything.
+    """
+
+    def __init__(self, data: Dict[str, str], key: bytes) -> None:
+        self._data = dict(data)
+        self._key = key
+        self._cipher: Optional[_Cipher] = None
+        self._encrypted: Set[str] = {k for k, v in self._data.items() if v.startswith("ENC:")}
+
+    def __getitem__(self, k: str) -> str:
+        value = self._data[k]
+        if k in self._encrypted:
+            if self._cipher is None:
+                self._cipher = _Cipher(self._key)
+            value = self._cipher.decrypt(value[4:])
+            self._data[k] = value
+            self._encrypted.discard(k)
+        return value
+
+    def __setitem__(self, k: str, value: str) -> None:
+        self._data[k] = value
+        self._encrypted.discard(k)
+
+    def __delitem__(self, k: str) -> None:
+        del self._data[k]
+        self._encrypted.discard(k)
+
+    def __contains__(self, k: object) -> bool:
+        # Mapping's default would go through __getitem__ and decrypt
+        return k in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyDecryptDict({len(self._data)} vars, {len(self._encrypted)} encrypted)"
+
+
+def decrypt_store(data: Dict[str, str], key: bytes,
+                  lazy: bool = False) -> Union[Dict[str, str], LazyDecryptDict]:
+    """Decrypt values that were encrypted by encrypt_store.
+
+    With ``lazy=True`` a LazyDecryptDict is returned instead, so only the
+    values actually read are decrypted (and a wrong key only fails then).
+    """
+    if lazy:
+        return LazyDecryptDict(data, key)
     result = {}
+    f = None
     for k, v in data.items():
         if v.startswith("ENC:"):
-            result[k] = decrypt_value(v[4:], key)
+            if f is None:
+                f = _Cipher(key)
+            result[k] = f.decrypt(v[4:])
         else:
             result[k] = v
     return result
@@ -130,9 +279,12 @@ def rotate_key(data: Dict[str, str], old_key: bytes, new_key: bytes) -> Dict[str
     """
     decrypted = decrypt_store(data, old_key)
     result = {}
+    f = None
     for k, v in data.items():
         if data[k].startswith("ENC:"):
-            result[k] = f"ENC:{encrypt_value(decrypted[k], new_key)}"
+            if f is None:
+                f = _Cipher(new_key)
+            result[k] = f"ENC:{f.encrypt(decrypted[k])}"
         else:
             result[k] = v
     return result
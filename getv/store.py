@@ -2,9 +2,121 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# One match per KEY=VALUE line; blank, comment and "="-less lines never match.
+# Surrounding whitespace is trimmed here, and a value wrapped in matching
+# quotes lands (unwrapped) in the double- or single-quoted group instead of
+# the bare one.
+_ENV_LINE_RE = re.compile(
+    r"""^[^\S\n]*([^#=\s][^=\n]*?)?[^\S\n]*=[^\S\n]*"""
+    r"""(?:"(.*)"|'(.*)'|(.*?))[^\S\n]*$""",
+    re.MULTILINE,
+)
+
+# path -> (mtime_ns, size, content digest, parsed vars), least recently used
+# first.  Bounded: the parsed values are often secrets, so don't hold every
+# profile the process ever touched.
+_READ_CACHE: "OrderedDict[Path, Tuple[int, int, bytes, Dict[str, str]]]" = OrderedDict()
+_READ_CACHE_MAX = 256
+# Guards every access to _READ_CACHE; reading and parsing happen outside it.
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def _digest(raw: bytes) -> bytes:
+    """Fast content fingerprint (xxh3 when installed, md5 otherwise)."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(raw)
+    return hashlib.md5(raw).digest()
+
+
+def _decode(raw: bytes) -> str:
+    """Decode file bytes like read_text() does, including universal newlines."""
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _parse_env(text: str) -> Dict[str, str]:
+    """Parse .env text into a dict of key=value pairs."""
+    data: Dict[str, str] = {}
+    if not text:
+        return data
+    for key, double_quoted, single_quoted, bare in _ENV_LINE_RE.findall(text):
+        # Keys repeat across profiles (LLM_MODEL, API_KEY, ...): share one object.
+        # Values are left alone — high cardinality, often secrets.
+        data[sys.intern(key)] = double_quoted or single_quoted or bare
+    return data
+
+
+def read_env_cached(path: str | Path, copy: bool = True, resolved: bool = False) -> Dict[str, str]:
+    """Read an .env file as a dict, re-parsing only when its content changed.
+
+    Unchanged ``(mtime_ns, size)`` returns the cached result without reading
+    the file.  Otherwise the bytes are hashed, and the previous parse is
+    reused if the digest still matches (e.g. a bare ``touch``).
+
+    With ``copy=False`` the shared cached dict is returned; it must not be
+    mutated.  ``resolved=True`` means ``path`` is already an absolute Path
+    (e.g. under a directory from expand_base_dir()); the expanduser() and
+    realpath() walk is skipped and the cache is keyed by the path as given.
+    """
+    if not resolved:
+        path = Path(path).expanduser().resolve()
+    return _read_resolved(path, copy)
+
+
+def _read_resolved(path: Path, copy: bool) -> Dict[str, str]:
+    """read_env_cached() for a path that is already absolute and resolved."""
+    st = path.stat()
+    with _READ_CACHE_LOCK:
+        cached = _READ_CACHE.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _READ_CACHE.move_to_end(path)
+            return cached[3].copy() if copy else cached[3]
+
+    raw = path.read_bytes()
+    digest = _digest(raw)
+    if cached is not None and cached[2] == digest:
+        parsed = cached[3]
+    else:
+        parsed = _parse_env(_decode(raw))
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[path] = (st.st_mtime_ns, st.st_size, digest, parsed)
+        _READ_CACHE.move_to_end(path)
+        if len(_READ_CACHE) > _READ_CACHE_MAX:
+            _READ_CACHE.popitem(last=False)
+    return parsed.copy() if copy else parsed
+
+
+def clear_read_cache() -> None:
+    """Drop all cached parses made by read_env_cached()."""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def _forget_cached_under(directory: Path) -> None:
+    """Drop cached parses of files inside directory (an absolute, resolved path)."""
+    with _READ_CACHE_LOCK:
+        for path in [p for p in _READ_CACHE if directory in p.parents]:
+            del _READ_CACHE[path]
+
 
 class EnvStore:
     """
@@ -21,39 +133,68 @@ class EnvStore:
 
         host = store.get("RPI_HOST")
         all_vars = store.as_dict()
+
+    With ``lazy=True`` the file is not read until a value is first accessed.
+    With ``readonly=True`` the raw text kept for comment-preserving saves is
+    dropped after parsing, and save() raises ValueError.
     """
 
-    def __init__(self, path: str | Path, auto_create: bool = True) -> None:
+    # list() can hold hundreds of these; no per-instance __dict__
+    __slots__ = ("path", "_data", "_raw_text", "_readonly", "_loaded", "_dirty")
+
+    def __init__(self, path: str | Path, auto_create: bool = True, lazy: bool = False,
+                 readonly: bool = False) -> None:
         self.path = Path(path).expanduser().resolve()
         self._data: Dict[str, str] = {}
-        self._raw_lines: List[str] = []
+        self._raw_text = ""
+        self._readonly = readonly
         self._loaded = False
+        self._dirty = False
 
         if self.path.exists():
-            self._load()
-        elif auto_create:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not lazy:
+                self._load()
+        else:
+            self._loaded = True  # nothing on disk to read
+            if auto_create:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
 
     # ── Read ─────────────────────────────────────────────────────────────
 
+    @classmethod
+    def _from_text(cls, path: Path, text: Optional[str], readonly: bool = False,
+                   data: Optional[Dict[str, str]] = None) -> "EnvStore":
+        """Build a store for an already-resolved path from text read by the caller.
+
+        ``data`` is the parse of ``text`` when the caller already has one.
+        With ``text=None`` only ``data`` is given; save() then reads the raw
+        text it needs for comments from disk.
+        """
+        store = cls.__new__(cls)
+        store.path = path
+        store._data = {}
+        store._raw_text = ""
+        store._readonly = readonly
+        store._set_text(text, data)
+        return store
+
     def _load(self) -> None:
         """Parse .env file, extracting key=value pairs."""
-        self._raw_lines = self.path.read_text(encoding="utf-8").splitlines()
+        self._set_text(self.path.read_text(encoding="utf-8"))
+
+    def _set_text(self, text: Optional[str], data: Optional[Dict[str, str]] = None) -> None:
+        # Lines are only needed by save(); split them lazily there
+        if not self._readonly:
+            self._raw_text = text
         self._data.clear()
-        for line in self._raw_lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            if "=" not in stripped:
-                continue
-            key, _, value = stripped.partition("=")
-            key = key.strip()
-            value = value.strip()
-            # Strip surrounding quotes
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            self._data[key] = value
+        self._data.update(_parse_env(text) if data is None else data)
         self._loaded = True
+        self._dirty = False
+
+    def _ensure_loaded(self) -> None:
+        """Parse the file now if construction was lazy."""
+        if not self._loaded:
+            self._load()
 
     def reload(self) -> "EnvStore":
         """Re-read from disk."""
@@ -63,58 +204,83 @@ class EnvStore:
 
     def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a variable value."""
+        self._ensure_loaded()
         return self._data.get(key, default)
 
     def __getitem__(self, key: str) -> str:
+        self._ensure_loaded()
         return self._data[key]
 
     def __contains__(self, key: str) -> bool:
+        self._ensure_loaded()
         return key in self._data
 
     def keys(self) -> List[str]:
+        self._ensure_loaded()
         return list(self._data.keys())
 
     def items(self) -> List[Tuple[str, str]]:
+        self._ensure_loaded()
         return list(self._data.items())
 
     def as_dict(self) -> Dict[str, str]:
         """Return all variables as a plain dict."""
-        return dict(self._data)
+        self._ensure_loaded()
+        return self._data.copy()
 
     def __len__(self) -> int:
+        self._ensure_loaded()
         return len(self._data)
 
     def __iter__(self) -> Iterator[str]:
+        self._ensure_loaded()
         return iter(self._data)
 
     # ── Write ────────────────────────────────────────────────────────────
 
     def set(self, key: str, value: str) -> "EnvStore":
         """Set a variable (in memory). Call save() to persist."""
+        self._ensure_loaded()
         self._data[key] = value
+        self._dirty = True
         return self
 
     def update(self, mapping: Dict[str, str]) -> "EnvStore":
         """Bulk-set from a dict."""
+        self._ensure_loaded()
         self._data.update(mapping)
+        self._dirty = True
         return self
 
     def delete(self, key: str) -> "EnvStore":
         """Remove a variable."""
+        self._ensure_loaded()
         self._data.pop(key, None)
+        self._dirty = True
         return self
 
     def save(self) -> Path:
         """
         Write to disk, preserving comments from the original file.
-        New keys are appended at the end.
+        New keys are appended at the end.  No-op when nothing changed since
+        the last load/save and the file already exists.
         """
+        if self._readonly:
+            raise ValueError(f"EnvStore is read-only: {self.path}")
+        if not self._dirty and self.path.exists():
+            return self.path
+        self._ensure_loaded()
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._raw_text is None:
+            try:
+                self._raw_text = self.path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                self._raw_text = ""
 
         written_keys: set = set()
         new_lines: List[str] = []
 
-        for line in self._raw_lines:
+        for line in self._raw_text.splitlines():
             stripped = line.strip()
             if stripped.startswith("#") or not stripped:
                 new_lines.append(line)
@@ -135,36 +301,98 @@ class EnvStore:
             if key not in written_keys:
                 new_lines.append(f"{key}={value}")
 
-        self.path.write_text("\n".join(new_lines) + "\n", encoding="utf-8")
-        self._raw_lines = new_lines
+        content = "\n".join(new_lines) + "\n"
+        self._dirty = False
+        if content == self._raw_text and self.path.exists():
+            # Idempotent edits (e.g. set(k, current_value)) leave the file alone
+            return self.path
+        self._write_atomic(content)
+        self._raw_text = content
+        with _READ_CACHE_LOCK:
+            _READ_CACHE.pop(self.path, None)
         return self.path
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["EnvStore"]:
+        """Group edits and write them with a single save() on exit.
+
+        Usage::
+
+            with store.batch():
+                store.set("RPI_HOST", "10.0.0.2")
+                store.delete("RPI_OLD")
+
+        If the block raises, nothing is written and the edits made inside
+        it are rolled back in memory too.
+        """
+        self._ensure_loaded()
+        snapshot, was_dirty = self._data.copy(), self._dirty
+        try:
+            yield self
+        except BaseException:
+            self._data.clear()
+            self._data.update(snapshot)
+            self._dirty = was_dirty
+            raise
+        self.save()
+
+    def _write_atomic(self, content: str) -> None:
+        """Write via a temp file in the same directory and os.replace() it in.
+
+        Readers (e.g. EnvWatcher) see either the old or the new file, never
+        a half-written one.  The original file mode is kept.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", buffering=64 * 1024) as f:
+                f.write(content)
+            if self.path.exists():
+                shutil.copymode(self.path, tmp)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
     # ── Merge / overlay ──────────────────────────────────────────────────
 
     def merge_from(self, other: "EnvStore") -> "EnvStore":
         """Overlay another store's values on top of this one."""
+        self._ensure_loaded()
+        other._ensure_loaded()
         self._data.update(other._data)
+        self._dirty = True
         return self
 
     def merge_file(self, path: str | Path) -> "EnvStore":
-        """Overlay values from another .env file."""
-        other = EnvStore(path, auto_create=False)
-        return self.merge_from(other)
+        """Overlay values from another .env file (a missing file adds nothing).
+
+        The overlay comes straight from the shared parse cache; no second
+        EnvStore is built for it.
+        """
+        self._ensure_loaded()
+        try:
+            self._data.update(read_env_cached(path, copy=False))
+        except FileNotFoundError:
+            pass
+        self._dirty = True
+        return self
 
     # ── Export ────────────────────────────────────────────────────────────
 
     def to_shell_export(self) -> str:
         """Generate shell export statements."""
-        lines = []
-        for key, value in sorted(self._data.items()):
-            escaped = value.replace("'", "'\\''")
-            lines.append(f"export {key}='{escaped}'")
-        return "\n".join(lines)
+        self._ensure_loaded()
+        from getv.formats import to_shell_export
+        return to_shell_export(self._data)
 
     def to_json(self) -> str:
         """Export as JSON string."""
-        import json
-        return json.dumps(self._data, indent=2, ensure_ascii=False)
+        self._ensure_loaded()
+        from getv.formats import to_json
+        return to_json(self._data)
 
     def __repr__(self) -> str:
-        return f"EnvStore({self.path}, {len(self._data)} vars)"
+        return f"EnvStore({self.path}, {len(self)} vars)"
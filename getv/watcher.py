@@ -1,6 +1,7 @@
 """File watcher — auto-reload .env profiles on change.
 
-Uses polling (cross-platform) with optional inotify acceleration on Linux.
+Uses kernel file events (inotify / FSEvents / ReadDirectoryChangesW) when
+``watchdog`` is installed, and falls back to cross-platform polling.
 
 Usage::
 
@@ -23,14 +24,48 @@ Or as a context manager::
 
 from __future__ import annotations
 
+import logging
 import os
+import queue
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from getv.store import EnvStore
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = None
+    Observer = None
+
+log = logging.getLogger(__name__)
+
+
+if FileSystemEventHandler is not None:
+
+    class _ProfileEventHandler(FileSystemEventHandler):
+        """Queue watchdog events for an EnvWatcher; filtering happens on dispatch."""
+
+        def __init__(self, watcher: "EnvWatcher") -> None:
+            super().__init__()
+            self._watcher = watcher
+
+        def on_created(self, event) -> None:
+            self._watcher._events.put(event.src_path)
+
+        def on_modified(self, event) -> None:
+            self._watcher._events.put(event.src_path)
+
+        def on_moved(self, event) -> None:
+            # Atomic saves (write temp file + rename) arrive as a move
+            self._watcher._events.put(event.dest_path)
+
+        def on_deleted(self, event) -> None:
+            self._watcher._events.put(event.src_path)
+
 
 class EnvWatcher:
     """Watch .env profiles for changes and call back on modification.
@@ -38,7 +73,11 @@ class EnvWatcher:
     Args:
         base_dir: getv home directory (e.g. ~/.getv).
         on_change: Callback ``(category: str, profile: str, store: EnvStore) -> None``.
+                   The store is writable; exceptions it raises are logged
+                   to the ``getv.watcher`` logger and watching continues.
         interval: Polling interval in seconds.
+        backend: ``"auto"`` (watchdog if installed, else polling),
+                 ``"watchdog"`` or ``"polling"``.
     """
 
     def __init__(
@@ -46,24 +85,56 @@ class EnvWatcher:
         base_dir: str = "~/.getv",
         on_change: Optional[Callable[[str, str, EnvStore], None]] = None,
         interval: float = 2.0,
+        backend: str = "auto",
     ) -> None:
+        if backend not in ("auto", "watchdog", "polling"):
+            raise ValueError(f"Unknown watcher backend: {backend}")
+        if backend == "watchdog" and Observer is None:
+            raise ImportError("Install watchdog for event-based watching: pip install watchdog")
         self.base_dir = Path(base_dir).expanduser().resolve()
         self.on_change = on_change
         self.interval = interval
-        self._mtimes: Dict[Path, float] = {}
+        self.backend = backend
+        # path -> (mtime_ns, size); size catches rewrites within one mtime tick
+        self._mtimes: Dict[str, Tuple[int, int]] = {}
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._observer = None
+        # Observer thread -> dispatcher/check(); None is the stop sentinel
+        self._events: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        # Changes the dispatcher reported since the last check(); guarded by _lock,
+        # which also makes the _mtimes compare-and-set atomic across threads
+        self._lock = threading.Lock()
+        self._unreported = 0
 
-    def _scan(self) -> Dict[Path, Tuple[str, str]]:
-        """Scan for all .env files and return {path: (category, profile)}."""
-        result: Dict[Path, Tuple[str, str]] = {}
-        if not self.base_dir.exists():
+    def _scan(self) -> Dict[str, Tuple[str, str, Tuple[int, int]]]:
+        """Scan for all .env files and return {path: (category, profile, (mtime_ns, size))}.
+
+        One ``os.scandir`` pass per directory; the stat comes from the
+        directory entry so callers don't need a second stat per file.
+        """
+        result: Dict[str, Tuple[str, str, Tuple[int, int]]] = {}
+        try:
+            cat_entries = os.scandir(self.base_dir)
+        except OSError:
             return result
-        for cat_dir in sorted(self.base_dir.iterdir()):
-            if not cat_dir.is_dir() or cat_dir.name.startswith("."):
-                continue
-            for env_file in sorted(cat_dir.glob("*.env")):
-                result[env_file] = (cat_dir.name, env_file.stem)
+        with cat_entries:
+            for cat in cat_entries:
+                if cat.name.startswith(".") or not cat.is_dir():
+                    continue
+                try:
+                    env_entries = os.scandir(cat.path)
+                except OSError:
+                    continue
+                with env_entries:
+                    for entry in env_entries:
+                        if not entry.name.endswith(".env") or not entry.is_file():
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        result[entry.path] = (cat.name, entry.name[:-4], (st.st_mtime_ns, st.st_size))
         return result
 
     def _check_once(self) -> int:
@@ -71,26 +142,16 @@ class EnvWatcher:
         changes = 0
         files = self._scan()
 
-        for path, (category, profile) in files.items():
-            try:
-                mtime = path.stat().st_mtime
-            except OSError:
-                continue
-
-            old_mtime = self._mtimes.get(path)
-            self._mtimes[path] = mtime
+        for path, (category, profile, stamp) in files.items():
+            old_stamp = self._mtimes.get(path)
+            self._mtimes[path] = stamp
 
-            if old_mtime is not None and mtime != old_mtime:
+            if old_stamp is not None and stamp != old_stamp:
                 changes += 1
-                if self.on_change:
-                    try:
-                        store = EnvStore(path, auto_create=False)
-                        self.on_change(category, profile, store)
-                    except Exception:
-                        pass
+                self._notify(category, profile, path)
 
         # Detect deleted files
-        deleted = set(self._mtimes) - set(files)
+        deleted = self._mtimes.keys() - files.keys()
         for path in deleted:
             del self._mtimes[path]
 
@@ -106,36 +167,145 @@ class EnvWatcher:
 
     def _scan_initial(self) -> None:
         """Populate mtimes without triggering callbacks."""
-        files = self._scan()
-        for path in files:
+        for path, (_, _, stamp) in self._scan().items():
+            self._mtimes[path] = stamp
+
+    def _handle_event(self, src_path) -> bool:
+        """Report a file event for a profile. Returns True if on_change was due."""
+        path = Path(os.fsdecode(src_path))
+        if path.suffix != ".env" or path.parent.parent != self.base_dir:
+            return False
+        category = path.parent.name
+        if category.startswith("."):
+            return False
+        key = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            # Deleted (or replaced and gone again) — just forget it
+            with self._lock:
+                self._mtimes.pop(key, None)
+            return False
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            old_stamp = self._mtimes.get(key)
+            self._mtimes[key] = stamp
+            if old_stamp is None or old_stamp == stamp:
+                # New file: just start tracking it, like the polling backend.
+                # Same stamp: several events per write (truncate, write, close)
+                return False
+        self._notify(category, path.stem, path)
+        return True
+
+    def _notify(self, category: str, profile: str, path: str | Path) -> None:
+        """Call on_change with a lazily loaded store; a failing callback is logged."""
+        if not self.on_change:
+            return
+        try:
+            store = EnvStore(path, auto_create=False, lazy=True)
+            self.on_change(category, profile, store)
+        except Exception:
+            # Keep watching; one bad callback must not stop the thread
+            log.exception("on_change failed for %s/%s", category, profile)
+
+    def _pending_events(self, first: Optional[str] = None) -> Tuple[List[str], bool]:
+        """Take every queued event path without blocking, de-duplicated.
+
+        Returns ``(paths, stopping)``; ``stopping`` is set once the stop
+        sentinel is seen.
+        """
+        paths: Dict[str, None] = {}
+        if first is not None:
+            paths[first] = None
+        while True:
             try:
-                self._mtimes[path] = path.stat().st_mtime
-            except OSError:
-                pass
+                path = self._events.get_nowait()
+            except queue.Empty:
+                return list(paths), False
+            if path is None:
+                return list(paths), True
+            paths[path] = None
+
+    def _dispatch(self) -> None:
+        """Deliver observer events until stop(); sleeps while nothing changes."""
+        while True:
+            first = self._events.get()
+            if first is None:
+                return
+            paths, stopping = self._pending_events(first)
+            changes = sum(self._handle_event(path) for path in paths)
+            if changes:
+                with self._lock:
+                    self._unreported += changes
+            if stopping:
+                return
+
+    def _start_observer(self) -> bool:
+        """Start the watchdog observer. Returns False to fall back to polling."""
+        if self.backend == "polling" or Observer is None or not self.base_dir.is_dir():
+            return False
+        self._scan_initial()
+        self._events = queue.SimpleQueue()
+        self._unreported = 0
+        observer = Observer()
+        observer.schedule(_ProfileEventHandler(self), str(self.base_dir), recursive=True)
+        observer.daemon = True
+        try:
+            observer.start()
+        except OSError:
+            # e.g. inotify watch limit reached
+            return False
+        self._observer = observer
+        self._thread = threading.Thread(target=self._dispatch, daemon=True, name="getv-watcher")
+        self._thread.start()
+        return True
 
     def start(self) -> None:
-        """Start watching in a background daemon thread."""
-        if self._thread and self._thread.is_alive():
+        """Start watching in the background (event observer or polling thread)."""
+        if self.watching:
             return
         self._stop.clear()
+        if self._start_observer():
+            return
         self._thread = threading.Thread(target=self._run, daemon=True, name="getv-watcher")
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the watcher."""
         self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+            self._events.put(None)
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
 
     def check(self) -> int:
-        """Manual one-shot check (no background thread needed). Returns change count."""
+        """Manual one-shot check (no background thread needed). Returns change count.
+
+        While the watchdog observer runs this drains its queued events and
+        also counts the changes its dispatcher thread delivered since the
+        previous check(); otherwise every profile is stat'ed once.
+        """
+        if self._observer is not None:
+            paths, stopping = self._pending_events()
+            if stopping:
+                self._events.put(None)  # leave the sentinel for the dispatcher
+            changes = sum(self._handle_event(path) for path in paths)
+            with self._lock:
+                changes += self._unreported
+                self._unreported = 0
+            return changes
         if not self._mtimes:
             self._scan_initial()
         return self._check_once()
 
     @property
     def watching(self) -> bool:
+        if self._observer is not None and self._observer.is_alive():
+            return True
         return self._thread is not None and self._thread.is_alive()
 
     def __enter__(self) -> "EnvWatcher":
@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    # Under pytest-xdist (`pytest -n auto --dist loadgroup`) keep each CLI e2e
+    # class on one worker: their class-scoped homes are then built once.
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if item.module.__name__.endswith("test_cli_e2e") and item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(f"cli_e2e_{item.cls.__name__}"))
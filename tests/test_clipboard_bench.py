@@ -0,0 +1,20 @@
+"""Micro-benchmarks for clipboard key detection (requires pytest-benchmark).
+
+Run only these with ``pytest --benchmark-only``; the plain test suite skips
+this module when pytest-benchmark is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from getv.integrations.clipboard import ClipboardGrab
+from tests.test_clipboard import PREFIX_CASES
+
+KEYS = tuple(key for key, _, _ in PREFIX_CASES)
+
+
+def test_detect_by_prefix_bench(benchmark):
+    detect = ClipboardGrab.detect_by_prefix
+    results = benchmark(lambda: [detect(k) for k in KEYS])
+    assert all(results)
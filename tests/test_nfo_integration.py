@@ -58,6 +58,29 @@ class TestPatchNfoRedaction:
             # assert "1234567890" not in result["API_KEY"]
             # assert "mysecret" not in result["PASSWORD"]
 
+    def test_repatch_wraps_original_and_caches(self):
+        import types
+        mock_redact = types.ModuleType("nfo.redact")
+        calls = []
+
+        def orig_is_sensitive(k):
+            calls.append(k)
+            return k == "OLD_PATTERN"
+
+        mock_redact.is_sensitive_key = orig_is_sensitive
+        mock_redact.redact_value = lambda v, visible_chars=0: "ORIGINAL"
+        mock_redact.redact_kwargs = lambda kw: kw
+        mock_nfo = types.ModuleType("nfo")
+        mock_nfo.redact = mock_redact
+
+        with patch.dict("sys.modules", {"nfo.redact": mock_redact, "nfo": mock_nfo}):
+            patch_nfo_redaction()
+            patch_nfo_redaction()
+            assert mock_redact.is_sensitive_key._getv_original is orig_is_sensitive
+            assert mock_redact.is_sensitive_key("OLD_PATTERN") is True
+            assert mock_redact.is_sensitive_key("OLD_PATTERN") is True
+            assert calls == ["OLD_PATTERN"]
+
 
 class TestRedactProfileDisplay:
 
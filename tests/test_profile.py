@@ -31,6 +31,12 @@ def test_get_dict(pm):
 def test_get_nonexistent(pm):
     assert pm.get("devices", "nonexistent") is None
     assert pm.get_dict("devices", "nonexistent") == {}
+    assert pm.get_dict_or_none("devices", "nonexistent") is None
+
+
+def test_get_dict_or_none_empty_profile(pm):
+    pm.set("devices", "blank", {})
+    assert pm.get_dict_or_none("devices", "blank") == {}
 
 
 def test_delete(pm):
@@ -80,6 +86,17 @@ def test_merge_profiles_none_skipped(pm):
     assert merged == {"KEY": "val"}
 
 
+def test_merge_profiles_inplace(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "10.0.0.1"})
+    base = {"RPI_HOST": "default", "APP_NAME": "fixpi"}
+    merged = pm.merge_profiles_inplace(base, devices="rpi3", llm="missing")
+    assert merged is base
+    assert base == {"RPI_HOST": "10.0.0.1", "APP_NAME": "fixpi"}
+    # The parse cache is not touched by later edits to base
+    base["RPI_HOST"] = "changed"
+    assert pm.get_dict("devices", "rpi3") == {"RPI_HOST": "10.0.0.1"}
+
+
 def test_find_by_key(pm):
     pm.set("devices", "rpi3", {"RPI_HOST": "192.168.1.10"})
     pm.set("devices", "rpi4", {"RPI_HOST": "192.168.1.20"})
@@ -106,3 +123,201 @@ def test_list_all(pm):
     assert "llm" in all_data
     assert len(all_data["devices"]) == 1
     assert len(all_data["llm"]) == 1
+
+
+def test_has_key(pm):
+    pm.set("llm", "groq", {"LLM_MODEL": "groq/llama3"})
+    pm.set("llm", "empty", {"LLM_MODEL": ""})
+    assert pm.has_key("llm", "groq", "LLM_MODEL") is True
+    assert pm.has_key("llm", "groq", "LLM") is False
+    assert pm.has_key("llm", "empty", "LLM_MODEL") is False
+    assert pm.has_key("llm", "missing", "LLM_MODEL") is False
+
+
+def test_list_cache_reuses_and_refreshes(pm):
+    import os
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    first = dict(pm.list("devices"))
+    parsed = pm._list_cache["devices"][2]
+    second = dict(pm.list("devices"))
+    assert pm._list_cache["devices"][2] is parsed  # nothing re-read
+    assert second["rpi3"] is not first["rpi3"]
+
+    # External edit of an existing profile is picked up
+    path = pm.base_dir / "devices" / "rpi3.env"
+    path.write_text("RPI_HOST=changed\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert dict(pm.list("devices"))["rpi3"].get("RPI_HOST") == "changed"
+
+    # Writes through the manager invalidate the listing
+    pm.set("devices", "rpi4", {"RPI_HOST": "b"})
+    assert pm.list_names("devices") == ["rpi3", "rpi4"]
+    assert [name for name, _ in pm.list("devices")] == ["rpi3", "rpi4"]
+    pm.delete("devices", "rpi4")
+    assert [name for name, _ in pm.list("devices")] == ["rpi3"]
+
+
+def test_lookups_do_not_create_category_dir(pm):
+    assert pm.get("ghost", "x") is None
+    assert pm.exists("ghost", "x") is False
+    assert pm.get_dict("ghost", "x") == {}
+    assert not (pm.base_dir / "ghost").exists()
+
+    pm.set("ghost", "x", {"A": "1"})
+    assert pm.get_dict("ghost", "x") == {"A": "1"}
+
+
+def test_list_many_profiles(pm):
+    for i in range(12):
+        pm.set("devices", f"dev{i:02d}", {"RPI_HOST": f"10.0.0.{i}"})
+    listed = pm.list("devices")
+    assert [name for name, _ in listed] == [f"dev{i:02d}" for i in range(12)]
+    assert listed[5][1].get("RPI_HOST") == "10.0.0.5"
+    assert listed[5][1].path == pm.base_dir / "devices" / "dev05.env"
+
+
+def test_list_all_reads_across_categories(pm):
+    for i in range(6):
+        pm.set("devices", f"dev{i}", {"RPI_HOST": f"10.0.0.{i}"})
+        pm.set("llm", f"llm{i}", {"LLM_MODEL": f"m{i}"})
+    all_data = pm.list_all()
+    assert all_data["devices"][4] == ("dev4", {"RPI_HOST": "10.0.0.4"})
+    assert all_data["llm"][2] == ("llm2", {"LLM_MODEL": "m2"})
+    assert pm.list_all() == all_data
+
+
+def test_set_many(pm):
+    pm.list("devices")  # populate the list cache
+    stores = pm.set_many({
+        ("devices", "rpi3"): {"RPI_HOST": "10.0.0.1", "RPI_USER": "pi"},
+        ("llm", "groq"): {"LLM_MODEL": "groq/llama3"},
+    })
+    assert stores[("llm", "groq")].get("LLM_MODEL") == "groq/llama3"
+    assert pm.get_dict("devices", "rpi3")["RPI_HOST"] == "10.0.0.1"
+    assert [name for name, _ in pm.list("devices")] == ["rpi3"]
+
+
+def test_get_cache_returns_independent_stores(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    first = pm.get("devices", "rpi3")
+    first.set("RPI_HOST", "unsaved")
+    assert pm.get("devices", "rpi3").get("RPI_HOST") == "a"
+    first.save()
+    assert pm.get("devices", "rpi3").get("RPI_HOST") == "unsaved"
+    pm.delete("devices", "rpi3")
+    assert pm.get("devices", "rpi3") is None
+
+
+def test_get_sees_other_writers_and_keeps_comments(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    assert pm.get("devices", "rpi3").get("RPI_HOST") == "a"
+    # Another manager's write is picked up without invalidate()
+    ProfileManager(pm.base_dir).set("devices", "rpi3", {"RPI_HOST": "b"})
+    assert pm.get("devices", "rpi3").get("RPI_HOST") == "b"
+
+    path = pm.base_dir / "devices" / "rpi3.env"
+    path.write_text("# lab pi\nRPI_HOST=c\n")
+    store = pm.get("devices", "rpi3")
+    store.set("RPI_USER", "pi")
+    store.save()
+    assert path.read_text() == "# lab pi\nRPI_HOST=c\nRPI_USER=pi\n"
+
+
+def test_list_table_columns(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "10.0.0.1", "RPI_PASSWORD": "secret123", "X": "y"})
+    rows = pm.list_table("devices", columns=["RPI_PASSWORD", "MISSING"])
+    assert list(rows[0]) == ["name", "RPI_PASSWORD", "MISSING"]
+    assert "secret123" not in rows[0]["RPI_PASSWORD"]
+    assert rows[0]["MISSING"] == ""
+
+
+def test_list_table_missing_sensitive_column_is_blank(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "10.0.0.1"})
+    rows = pm.list_table("devices", columns=["RPI_HOST", "RPI_PASSWORD"])
+    assert rows[0] == {"name": "rpi3", "RPI_HOST": "10.0.0.1", "RPI_PASSWORD": ""}
+    assert pm.list_names("devices") == ["rpi3"]
+
+
+def test_find_by_key_index_follows_changes(pm):
+    from getv.store import EnvStore
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    pm.set("devices", "rpi4", {"RPI_HOST": "b"})
+    assert pm.find_by_key("devices", "RPI_HOST", "a") == ["rpi3"]
+    index = pm._key_index["devices"]
+    assert pm.find_by_key("devices", "RPI_HOST", "b") == ["rpi4"]
+    assert pm._key_index["devices"] is index  # reused while nothing changed
+
+    # Edited outside the manager
+    EnvStore(pm.base_dir / "devices" / "rpi4.env").set("RPI_HOST", "a").save()
+    assert pm.find_by_key("devices", "RPI_HOST", "a") == ["rpi3", "rpi4"]
+    pm.delete("devices", "rpi3")
+    assert pm.find_by_key("devices", "RPI_HOST", "a") == ["rpi4"]
+
+
+def test_list_stores_are_not_shared(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "v"})
+    listed = dict(pm.list("devices"))
+    listed["rpi3"].set("RPI_HOST", "poisoned")
+    assert dict(pm.list("devices"))["rpi3"].get("RPI_HOST") == "v"
+    assert pm.list_all()["devices"] == [("rpi3", {"RPI_HOST": "v"})]
+    assert pm.find_by_key("devices", "RPI_HOST", "v") == ["rpi3"]
+    assert pm.list_table("devices")[0]["RPI_HOST"] == "v"
+
+
+def test_listed_store_can_be_saved(pm):
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    store = dict(pm.list("devices"))["rpi3"]
+    store.set("RPI_HOST", "b").save()
+    assert pm.get_dict("devices", "rpi3") == {"RPI_HOST": "b"}
+    assert dict(pm.list("devices"))["rpi3"].get("RPI_HOST") == "b"
+
+
+def test_invalidate_drops_read_cache_entries(pm):
+    from getv.store import _READ_CACHE
+    pm.set("devices", "rpi3", {"RPI_HOST": "a"})
+    pm.get_dict("devices", "rpi3")
+    path = (pm.base_dir / "devices" / "rpi3.env").resolve()
+    assert path in _READ_CACHE
+    pm.invalidate("devices")
+    assert path not in _READ_CACHE
+
+
+def test_deleted_category_dir_is_recreated(pm, monkeypatch):
+    import shutil
+    # Short-lived managers for the same home share the created-directory memo
+    def no_mkdir(self, *args, **kwargs):
+        raise AssertionError(f"unexpected mkdir of {self}")
+    with monkeypatch.context() as m:
+        m.setattr(Path, "mkdir", no_mkdir)
+        ProfileManager(pm.base_dir).add_category("devices")
+
+    # A write into a directory removed behind the memo's back recreates it
+    shutil.rmtree(pm.base_dir / "devices")
+    other = ProfileManager(pm.base_dir)
+    other.add_category("devices")
+    other.set("devices", "rpi3", {"RPI_HOST": "a"})
+    assert pm.list_names("devices") == ["rpi3"]
+
+    # A lookup that finds it gone forgets it, so add_category recreates it
+    shutil.rmtree(pm.base_dir / "devices")
+    assert pm.list("devices") == []
+    ProfileManager(pm.base_dir).add_category("devices")
+    assert (pm.base_dir / "devices").is_dir()
+
+
+def test_invalidate_forgets_resolved_base_dir(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    for target, host in ((first, "a"), (second, "b")):
+        ProfileManager(target).set("devices", "rpi3", {"RPI_HOST": host})
+    home = tmp_path / "home"
+    home.symlink_to(first)
+    pm = ProfileManager(home)
+    assert pm.base_dir == first
+
+    home.unlink()
+    home.symlink_to(second)
+    pm.invalidate()
+    retargeted = ProfileManager(home)
+    assert retargeted.base_dir == second
+    assert retargeted.get_dict("devices", "rpi3") == {"RPI_HOST": "b"}
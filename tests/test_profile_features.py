@@ -55,6 +55,14 @@ class TestValidation:
         store = pm.set("llm", "groq", {"LLM_MODEL": "llama3"})
         assert store.get("LLM_MODEL") == "llama3"
 
+    def test_set_many_validates_before_writing(self, pm):
+        with pytest.raises(ProfileValidationError):
+            pm.set_many({
+                ("llm", "ok"): {"LLM_MODEL": "x", "API_KEY": "k"},
+                ("llm", "bad"): {"LLM_MODEL": "x"},
+            }, validate=True)
+        assert not pm.exists("llm", "ok")
+
 
 class TestDiff:
 
@@ -126,3 +134,53 @@ class TestCopy:
     def test_copy_nonexistent_source_raises(self, pm):
         with pytest.raises(FileNotFoundError):
             pm.copy("llm", "nonexistent", "llm", "backup")
+
+
+class TestZipBackend:
+
+    @pytest.fixture
+    def zpm(self, tmp_path):
+        p = ProfileManager(tmp_path, backend="zip")
+        p.add_category("llm", required_keys=["LLM_MODEL", "API_KEY"])
+        p.add_category("devices")
+        return p
+
+    def test_invalid_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            ProfileManager(tmp_path, backend="tar")
+
+    def test_profiles_live_in_one_archive(self, zpm, tmp_path):
+        zpm.set_many({
+            ("llm", "groq"): {"LLM_MODEL": "groq/llama3", "API_KEY": "gsk_1"},
+            ("llm", "openai"): {"LLM_MODEL": "gpt-4", "API_KEY": "sk_1"},
+        })
+        assert [p.name for p in (tmp_path / "llm").iterdir()] == ["profiles.zip"]
+        assert zpm.list_names("llm") == ["groq", "openai"]
+        assert zpm.get_dict("llm", "groq") == {"LLM_MODEL": "groq/llama3", "API_KEY": "gsk_1"}
+        assert zpm.exists("llm", "openai")
+        assert not zpm.exists("llm", "missing")
+        assert zpm.get("llm", "missing") is None
+
+    def test_set_merges_into_existing_profile(self, zpm):
+        zpm.set("devices", "rpi3", {"HOST": "a", "USER": "pi"})
+        store = zpm.set("devices", "rpi3", {"HOST": "b"})
+        assert store.as_dict() == {"HOST": "b", "USER": "pi"}
+        with pytest.raises(ValueError):
+            store.save()  # read-only; write through set()
+
+    def test_delete_copy_and_search(self, zpm):
+        zpm.set("devices", "rpi3", {"HOST": "a"})
+        zpm.set("devices", "rpi4", {"HOST": "b"})
+        zpm.copy("devices", "rpi3", "devices", "rpi5")
+        assert zpm.find_by_key("devices", "HOST", "a") == ["rpi3", "rpi5"]
+        assert zpm.diff("devices", "rpi3", "rpi4") == {"HOST": ("a", "b")}
+        assert zpm.merge_profiles({"X": "1"}, devices="rpi4") == {"X": "1", "HOST": "b"}
+        assert zpm.has_key("devices", "rpi4", "HOST")
+        assert zpm.delete("devices", "rpi3") is True
+        assert zpm.delete("devices", "rpi3") is False
+        assert [name for name, _ in zpm.list_all()["devices"]] == ["rpi4", "rpi5"]
+
+    def test_validation_applies(self, zpm):
+        with pytest.raises(ProfileValidationError):
+            zpm.set("llm", "bad", {"LLM_MODEL": "x"}, validate=True)
+        assert zpm.list_names("llm") == []
@@ -112,3 +112,73 @@ def test_rotate_key():
     from cryptography.fernet import InvalidToken
     with _pytest.raises(InvalidToken):
         decrypt_store(rotated, old_key)
+
+
+def test_mask_dict_without_sensitive_keys():
+    data = {"RPI_HOST": "10.0.0.1", "RPI_USER": "pi"}
+    masked = mask_dict(data)
+    assert masked == data
+    assert masked is not data
+
+
+def test_decrypt_store_lazy_decrypts_on_read():
+    from cryptography.fernet import InvalidToken
+    key = generate_key()
+    data = {"RPI_HOST": "192.168.1.10", "RPI_PASSWORD": "secret", "API_KEY": "sk-123"}
+    encrypted = encrypt_store(data, key)
+
+    lazy = decrypt_store(encrypted, key, lazy=True)
+    assert lazy["RPI_HOST"] == "192.168.1.10"
+    assert lazy._cipher is None  # nothing decrypted yet
+    assert lazy["RPI_PASSWORD"] == "secret"
+    assert dict(lazy) == data
+
+    wrong = decrypt_store(encrypted, generate_key(), lazy=True)
+    # Membership, size and key iteration never decrypt
+    assert "API_KEY" in wrong and "MISSING" not in wrong
+    assert len(wrong) == 3
+    assert sorted(wrong) == sorted(data)
+    assert wrong._cipher is None
+    assert wrong["RPI_HOST"] == "192.168.1.10"
+    with pytest.raises(InvalidToken):
+        wrong["API_KEY"]
+
+
+def test_decrypt_value_reads_legacy_fernet_tokens():
+    from cryptography.fernet import Fernet
+    key = generate_key()
+    legacy = Fernet(key).encrypt(b"old-secret").decode("ascii")
+    assert decrypt_value(legacy, key) == "old-secret"
+    assert decrypt_store({"API_KEY": f"ENC:{legacy}"}, key) == {"API_KEY": "old-secret"}
+
+    token = encrypt_value("new-secret", key)
+    assert token.startswith("gcm:")
+    assert decrypt_value(token, key) == "new-secret"
+
+
+def test_decrypt_value_rejects_tampered_gcm_token():
+    from cryptography.fernet import InvalidToken
+    key = generate_key()
+    token = encrypt_value("secret", key)
+    tampered = token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1]
+    with pytest.raises(InvalidToken):
+        decrypt_value(tampered, key)
+
+
+def test_gcm_key_is_derived_not_raw_fernet_bytes():
+    import base64
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    key = generate_key()
+    raw = base64.urlsafe_b64decode(encrypt_value("secret", key)[4:])
+    with pytest.raises(Exception):
+        AESGCM(base64.urlsafe_b64decode(key)).decrypt(raw[:12], raw[12:], None)
+
+
+def test_missing_cryptography_gives_install_hint(monkeypatch):
+    import base64
+    import sys
+    from getv import security
+    # AESGCM already loaded; only the key-derivation import fails
+    monkeypatch.setitem(sys.modules, "cryptography.hazmat.primitives.kdf.hkdf", None)
+    with pytest.raises(ImportError, match=r"getv\[crypto\]"):
+        encrypt_value("secret", base64.urlsafe_b64encode(b"k" * 32))
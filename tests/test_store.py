@@ -125,6 +125,16 @@ def test_to_json(tmp_env):
     assert data["DB_HOST"] == "localhost"
 
 
+def test_to_json_matches_stdlib_layout(monkeypatch):
+    import json
+    from getv import formats
+    data = {"A": "zażółć", "B": 'say "hi"', "C": ""}
+    expected = json.dumps(data, indent=2, ensure_ascii=False)
+    assert formats.to_json(data) == expected
+    monkeypatch.setattr(formats, "orjson", None)
+    assert formats.to_json(data) == expected
+
+
 def test_auto_create(tmp_path):
     new_file = tmp_path / "subdir" / "new.env"
     store = EnvStore(new_file)
@@ -150,3 +160,206 @@ def test_reload(tmp_env):
     tmp_env.write_text("DB_HOST=changed\n")
     store.reload()
     assert store.get("DB_HOST") == "changed"
+
+
+def test_read_env_cached_detects_changes(tmp_path):
+    import os
+    from getv.store import read_env_cached, _READ_CACHE
+
+    env_file = tmp_path / "cached.env"
+    env_file.write_text("A=1\nB=2\n")
+    assert read_env_cached(env_file) == {"A": "1", "B": "2"}
+
+    # Touch without content change: same digest, parsed dict is reused
+    parsed = _READ_CACHE[env_file.resolve()][3]
+    st = env_file.stat()
+    os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert read_env_cached(env_file) == {"A": "1", "B": "2"}
+    assert _READ_CACHE[env_file.resolve()][3] is parsed
+
+    # Real edit is picked up
+    env_file.write_text("A=changed\n")
+    os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 2 * 10**9))
+    assert read_env_cached(env_file) == {"A": "changed"}
+
+
+def test_save_invalidates_read_cache(tmp_env):
+    from getv.store import read_env_cached
+
+    assert read_env_cached(tmp_env)["DB_HOST"] == "localhost"
+    store = EnvStore(tmp_env)
+    store.set("DB_HOST", "10.0.0.1")
+    store.save()
+    assert read_env_cached(tmp_env)["DB_HOST"] == "10.0.0.1"
+
+
+def test_parse_edge_cases(tmp_path):
+    env_file = tmp_path / "edge.env"
+    env_file.write_text(
+        "  # comment with = sign\n"
+        "NO_EQUALS_LINE\n"
+        "  SPACED  =  padded value  \n"
+        "EMPTY=\n"
+        "URL=http://x/?a=1&b=2\n"
+        "CRLF=windows\r\n"
+        "DUP=first\n"
+        "DUP=second\n"
+    )
+    store = EnvStore(env_file)
+    assert store.as_dict() == {
+        "SPACED": "padded value",
+        "EMPTY": "",
+        "URL": "http://x/?a=1&b=2",
+        "CRLF": "windows",
+        "DUP": "second",
+    }
+
+
+def test_save_without_changes_does_not_rewrite(tmp_env):
+    import os
+    os.utime(tmp_env, ns=(0, 0))
+    store = EnvStore(tmp_env)
+    store.save()
+    assert tmp_env.stat().st_mtime_ns == 0
+
+    # Setting a key to its current value is also a no-op on disk
+    store.set("DB_HOST", "localhost")
+    store.save()
+    assert tmp_env.stat().st_mtime_ns == 0
+
+    store.set("DB_HOST", "10.0.0.1")
+    store.save()
+    assert tmp_env.stat().st_mtime_ns != 0
+
+
+def test_lazy_load(tmp_env):
+    store = EnvStore(tmp_env, auto_create=False, lazy=True)
+    assert not store._loaded
+    assert store.get("DB_HOST") == "localhost"
+    assert store._loaded
+
+    # Writing through a lazy store keeps the keys already on disk
+    lazy = EnvStore(tmp_env, lazy=True)
+    lazy.set("NEW", "1").save()
+    assert EnvStore(tmp_env).as_dict()["DB_PORT"] == "5432"
+
+
+def test_save_is_atomic_and_keeps_mode(tmp_env):
+    import os
+    os.chmod(tmp_env, 0o640)
+    store = EnvStore(tmp_env)
+    store.set("DB_HOST", "10.0.0.1").save()
+    assert EnvStore(tmp_env).get("DB_HOST") == "10.0.0.1"
+    assert (tmp_env.stat().st_mode & 0o777) == 0o640
+    assert [p.name for p in tmp_env.parent.iterdir()] == ["test.env"]
+
+
+def test_readonly_store(tmp_env):
+    store = EnvStore(tmp_env, auto_create=False, readonly=True)
+    assert store.get("DB_PORT") == "5432"
+    assert store._raw_text == ""
+    with pytest.raises(ValueError):
+        store.set("DB_PORT", "1").save()
+    assert EnvStore(tmp_env).get("DB_PORT") == "5432"
+
+
+def test_keys_are_interned(tmp_path):
+    (tmp_path / "a.env").write_text("LLM_MODEL=x\n")
+    (tmp_path / "b.env").write_text("LLM_MODEL=y\n")
+    key_a = EnvStore(tmp_path / "a.env").keys()[0]
+    key_b = EnvStore(tmp_path / "b.env").keys()[0]
+    assert key_a is key_b
+
+
+def test_batch_writes_once_on_exit(tmp_env):
+    store = EnvStore(tmp_env)
+    with store.batch():
+        store.set("DB_HOST", "10.0.0.1")
+        store.delete("APP_NAME")
+        assert EnvStore(tmp_env).get("DB_HOST") == "localhost"
+    on_disk = EnvStore(tmp_env)
+    assert on_disk.get("DB_HOST") == "10.0.0.1"
+    assert "APP_NAME" not in on_disk
+
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.set("DB_HOST", "lost")
+            raise RuntimeError
+    assert EnvStore(tmp_env).get("DB_HOST") == "10.0.0.1"
+    # Rolled back in memory as well, so a later save() can't write it
+    assert store.get("DB_HOST") == "10.0.0.1"
+    store.save()
+    assert EnvStore(tmp_env).get("DB_HOST") == "10.0.0.1"
+
+
+def test_batch_that_reverts_its_edits_does_not_rewrite(tmp_env):
+    import os
+    os.utime(tmp_env, ns=(0, 0))
+    store = EnvStore(tmp_env)
+    with store.batch():
+        store.set("DB_HOST", "10.0.0.1")
+        store.set("DB_HOST", "localhost")
+    assert tmp_env.stat().st_mtime_ns == 0
+
+
+def test_merge_file_missing_and_cache_isolation(tmp_path):
+    from getv.store import read_env_cached
+    overlay = tmp_path / "overlay.env"
+    overlay.write_text("C=3\n")
+    store = EnvStore(tmp_path / "base.env")
+    store.merge_file(tmp_path / "missing.env")
+    assert len(store) == 0
+    store.merge_file(overlay).set("C", "changed")
+    assert read_env_cached(overlay) == {"C": "3"}
+
+
+def test_read_env_cached_normalizes_newlines(tmp_path):
+    from getv.store import read_env_cached
+    env_file = tmp_path / "cr.env"
+    env_file.write_bytes(b"A=1\rB=2\r\nC=3\n")
+    assert read_env_cached(env_file) == {"A": "1", "B": "2", "C": "3"}
+    assert read_env_cached(env_file) == EnvStore(env_file).as_dict()
+
+
+def test_read_cache_is_bounded(tmp_path, monkeypatch):
+    from getv import store as store_mod
+    monkeypatch.setattr(store_mod, "_READ_CACHE_MAX", 2)
+    store_mod.clear_read_cache()
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.env"
+        path.write_text(f"K={name}\n")
+        paths.append(path.resolve())
+        store_mod.read_env_cached(path)
+    assert list(store_mod._READ_CACHE) == paths[1:]
+
+
+def test_read_cache_survives_concurrent_eviction(tmp_path, monkeypatch):
+    import threading
+    from getv import store as store_mod
+    monkeypatch.setattr(store_mod, "_READ_CACHE_MAX", 2)
+    store_mod.clear_read_cache()
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"p{i}.env"
+        path.write_text(f"K={i}\n")
+        paths.append(path)
+    errors = []
+
+    def reader(offset):
+        try:
+            for n in range(300):
+                path = paths[(n + offset) % len(paths)]
+                assert store_mod.read_env_cached(path)["K"] == path.stem[1:]
+                if n % 50 == 0:
+                    store_mod._forget_cached_under(tmp_path.resolve())
+        except Exception as exc:  # pragma: no cover - only on failure
+            errors.append(exc)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(store_mod._READ_CACHE) <= 2
@@ -1,5 +1,6 @@
 """Tests for getv.watcher — file watching / auto-reload."""
 
+import os
 import time
 import pytest
 from pathlib import Path
@@ -52,6 +53,15 @@ class TestEnvWatcher:
         assert changes[0][1] == "groq"
         assert changes[0][2]["LLM_MODEL"] == "gpt-4"
 
+    def test_check_detects_resize_within_mtime_tick(self, tmp_path, pm):
+        w = EnvWatcher(str(tmp_path))
+        w._scan_initial()
+        env_file = tmp_path / "llm" / "groq.env"
+        st = env_file.stat()
+        env_file.write_text("LLM_MODEL=a-much-longer-model-name\n")
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns))  # same mtime, new size
+        assert w.check() == 1
+
     def test_check_detects_new_file(self, tmp_path, pm):
         changes = []
         w = EnvWatcher(str(tmp_path), on_change=lambda c, p, s: changes.append((c, p)))
@@ -99,7 +109,7 @@ class TestEnvWatcher:
         assert len(w._mtimes) == 0
         assert w.check() == 0
 
-    def test_callback_exception_doesnt_crash(self, tmp_path, pm):
+    def test_callback_exception_doesnt_crash(self, tmp_path, pm, caplog):
         """on_change raising an exception should not crash the watcher."""
         def bad_callback(cat, prof, store):
             raise RuntimeError("boom")
@@ -111,6 +121,89 @@ class TestEnvWatcher:
         import os
         os.utime(env_file, (time.time() + 1, time.time() + 1))
 
-        # Should not raise
+        # Should not raise, but is logged
         count = w.check()
         assert count == 1
+        assert "on_change failed for llm/groq" in caplog.text
+        assert "boom" in caplog.text
+
+    def test_callback_can_save_store(self, tmp_path, pm):
+        def on_change(cat, prof, store):
+            if store.get("SEEN") is None:
+                store.set("SEEN", "1")
+                store.save()
+
+        w = EnvWatcher(str(tmp_path), on_change=on_change)
+        w._scan_initial()
+        env_file = tmp_path / "llm" / "groq.env"
+        env_file.write_text("# edited\nLLM_MODEL=gpt-4\n")
+        os.utime(env_file, (time.time() + 1, time.time() + 1))
+
+        assert w.check() == 1
+        assert env_file.read_text() == "# edited\nLLM_MODEL=gpt-4\nSEEN=1\n"
+
+
+class TestWatchdogBackend:
+
+    def test_invalid_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            EnvWatcher(str(tmp_path), backend="magic")
+
+    def test_event_detects_modification(self, tmp_path, pm):
+        pytest.importorskip("watchdog")
+        changes = []
+        w = EnvWatcher(str(tmp_path), backend="watchdog",
+                       on_change=lambda c, p, s: changes.append((c, p, s.get("LLM_MODEL"))))
+        with w:
+            assert w._observer is not None
+            pm.set("llm", "groq", {"LLM_MODEL": "gpt-4"})
+            deadline = time.time() + 5
+            while not any(m == "gpt-4" for _, _, m in changes) and time.time() < deadline:
+                time.sleep(0.02)
+        assert ("llm", "groq", "gpt-4") in changes
+        assert not w.watching
+
+    def test_check_counts_changes_with_live_observer(self, tmp_path, pm):
+        pytest.importorskip("watchdog")
+        fired = []
+        w = EnvWatcher(str(tmp_path), backend="watchdog",
+                       on_change=lambda c, p, s: fired.append(p))
+        with w:
+            for i in range(3):
+                pm.set("llm", "groq", {"LLM_MODEL": "m" * (i + 5)})
+                deadline = time.time() + 5
+                while len(fired) <= i and time.time() < deadline:
+                    time.sleep(0.02)
+            counted = w.check()
+        assert counted == len(fired) >= 3
+        assert w.check() == 0
+
+    def test_new_file_does_not_trigger_callback(self, tmp_path, pm):
+        pytest.importorskip("watchdog")
+        changes = []
+        w = EnvWatcher(str(tmp_path), backend="watchdog",
+                       on_change=lambda c, p, s: changes.append((c, p)))
+        new_key = str(tmp_path / "llm" / "openai.env")
+        with w:
+            pm.set("llm", "openai", {"LLM_MODEL": "gpt-4"})
+            deadline = time.time() + 5
+            while new_key not in w._mtimes and time.time() < deadline:
+                time.sleep(0.02)
+            time.sleep(0.1)  # let any trailing events for the create arrive
+            assert new_key in w._mtimes
+            assert changes == []
+            assert w.check() == 0
+
+            # A later edit of the now-tracked file is reported
+            pm.set("llm", "openai", {"LLM_MODEL": "gpt-4o"})
+            deadline = time.time() + 5
+            while not changes and time.time() < deadline:
+                time.sleep(0.02)
+        assert changes == [("llm", "openai")]
+
+    def test_queued_events_are_coalesced(self, tmp_path):
+        w = EnvWatcher(str(tmp_path), backend="polling")
+        for p in ("a.env", "b.env", "a.env"):
+            w._events.put(p)
+        w._events.put(None)
+        assert w._pending_events() == (["a.env", "b.env"], True)